@@ -4,52 +4,67 @@ judges.py
 This module implements:
   - A SuperJudge that is also a Judge (extends JudgeBase), orchestrating sub-judges.
   - A Mediator-like pattern: SuperJudge collects notifications from sub-judges.
-  - A Plan used by the SuperJudge to evaluate each sub-judge's output in a structured way.
   - A Factory (JudgeFactory) that builds sub-judges from a Pydantic Assembly.
   - An Orchestrator (JudgeOrchestrator) that merges the SuperJudge + JudgeFactory logic into a
     single evaluation procedure.
+  - Verdict caches (VerdictCache, SemanticVerdictCache) that let the Orchestrator skip the
+    sub-judges entirely when an Assembly has already judged the same (or a similar) prompt.
 
 Classes:
     JudgeBase: Abstract base for a judge that can evaluate a prompt.
     ConcreteJudge: A judge that is a ChatCompletionAgent for LLM interactions.
     SuperJudge: Extends JudgeBase, orchestrates multiple sub-judges, collects outputs, and
                 can itself be considered a "judge" with a final verdict.
-    JudgeEvaluationPlan: A Plan describing how the SuperJudge calls each sub-judge's evaluate().
     JudgeFactory: Builds sub-judges from an Assembly. Optionally also builds or configures a Kernel.
+    VerdictCache: In-process LRU of final verdicts keyed by (assembly id, version, prompt hash).
+    SemanticVerdictCache: Optional cache that matches prompts by embedding cosine similarity.
     JudgeOrchestrator: High-level class that uses the Factory + SuperJudge to produce a final verdict.
 
 Usage:
     # 1) Create or load an Assembly (with .judges).
     # 2) Call JudgeOrchestrator.run_evaluation(assembly, prompt).
     #    -> Returns the final verdict from the SuperJudge after orchestrating sub-judges.
+    #    Or iterate JudgeOrchestrator.run_evaluation_stream(assembly, prompt) to receive each
+    #    sub-judge's evaluation as soon as it is available.
 """
 
 import asyncio
-import json
+import hashlib
+import io
+import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import semantic_kernel as sk
 from azure.cosmos import exceptions
-from azure.cosmos.aio import CosmosClient
-from azure.identity.aio import DefaultAzureCredential
+from azure.cosmos.aio import ContainerProxy
 from semantic_kernel.agents.chat_completion.chat_completion_agent import ChatCompletionAgent
-from semantic_kernel.connectors.ai import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai import FunctionChoiceBehavior, PromptExecutionSettings
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
-# If you use SK planners, e.g., Plan
-from semantic_kernel.planners.plan import Plan
-
 # Import your Pydantic models
 from app.schemas import Assembly, Judge
 
-COSMOS_DB_NAME = os.getenv("COSMOS_DB_NAME", "mydb")
-COSMOS_ENDPOINT = os.getenv("COSMOS_ENDPOINT", "https://myendpoint.documents.azure.com:443/")
-COSMOS_ASSEMBLY_TABLE = os.getenv("COSMOS_ASSEMBLY_TABLE", "assemblies")
+logger = logging.getLogger(__name__)
+
+VERDICT_CACHE_SIZE = int(os.getenv("VERDICT_CACHE_SIZE", "1024"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+MAX_INFLIGHT_JUDGES = int(os.getenv("MAX_INFLIGHT_JUDGES", "8"))
+
+# Placeholders standing in for a missing answer; verdicts containing them are never cached.
+NO_OUTPUT = "[No output from LLM]"
+NO_EVALUATIONS = "[No evaluations received]"
+
+# Streamed items that carry function calling traffic rather than the judge's answer.
+_SKIP_CONTENT_TYPES = (FunctionCallContent, FunctionResultContent)
+# Shared by every judge's execution settings; it is only read during invocation.
+_AUTO_FUNCTION_CHOICE = FunctionChoiceBehavior.Auto()
 
 
 class Mediator(ABC):
@@ -93,59 +108,65 @@ class JudgeBase(ABC):
 class ConcreteJudge(JudgeBase):
     """
     A judge that uses a ChatCompletionAgent to evaluate a prompt.
-    Each instance references a shared Kernel but instantiates its own Agent in `evaluate()`.
+    Each instance references a shared Kernel and builds its Agent once, at construction time,
+    so repeated calls to `evaluate()` only pay for the LLM round-trip.
     """
 
-    def __init__(self, judge_data: Judge, kernel: sk.Kernel) -> None:
+    def __init__(
+        self,
+        judge_data: Judge,
+        kernel: sk.Kernel,
+        settings: Optional[PromptExecutionSettings] = None,
+    ) -> None:
         super().__init__()
         self.judge_data = judge_data
         self.kernel = kernel
 
-    async def evaluate(self, prompt: str) -> None:
-        """
-        Use ChatCompletionAgent to evaluate the prompt. Once done,
-        notify the mediator with the result.
-        """
+        if settings is None:
+            settings = ConcreteJudge.resolve_settings(kernel, str(self.judge_data.model))
 
-        try:
-            meta = json.loads(self.judge_data.metaprompt)  # e.g. {"text": "..."}
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in metaprompt: {str(e)}") from e
-
-        system_text = meta.get("text", "System Prompt Missing")
-
-        settings = self.kernel.get_prompt_execution_settings_from_service_id(
-            service_id=str(self.judge_data.model)
-        )
-        if not settings:
-            settings = self.kernel.get_prompt_execution_settings_from_service_id("default")
-
-        settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
-
-        agent = ChatCompletionAgent(
+        self._agent = ChatCompletionAgent(
             service_id=str(self.judge_data.model) or "default",
             kernel=self.kernel,
             name=self.judge_data.name,
-            instructions=system_text,
+            instructions=self.judge_data.system_text,
             arguments=KernelArguments(settings=settings),
         )
 
-        # 4) Chat conversation
+    @staticmethod
+    def resolve_settings(kernel: sk.Kernel, service_id: str) -> PromptExecutionSettings:
+        """
+        Look up the execution settings of a kernel service, falling back to "default".
+        Settings are copied by the chat completion service on every call, so the returned
+        object can be shared by all judges using the same model.
+        """
+        settings = kernel.get_prompt_execution_settings_from_service_id(service_id=service_id)
+        if not settings:
+            settings = kernel.get_prompt_execution_settings_from_service_id("default")
+
+        settings.function_choice_behavior = _AUTO_FUNCTION_CHOICE
+        return settings
+
+    async def evaluate(self, prompt: str) -> None:
+        """
+        Use the cached ChatCompletionAgent to evaluate the prompt. Once done,
+        notify the mediator with the result.
+        """
+
+        # Chat conversation, fresh for every prompt
         chat_history = ChatHistory()
         chat_history.add_user_message(prompt)
 
-        final_content = []
-        async for msg_content in agent.invoke(chat_history):
+        buf = io.StringIO()
+        async for msg_content in self._agent.invoke(chat_history):
             # Filter function calls (if not needed)
-            if any(
-                isinstance(item, (FunctionCallContent, FunctionResultContent))
-                for item in msg_content.items
-            ):
+            if any(type(item) in _SKIP_CONTENT_TYPES for item in msg_content.items):
                 continue
             if msg_content.content.strip():
-                final_content.append(msg_content.content)
+                buf.write(msg_content.content)
+                buf.write("\n")
 
-        result_str = "\n".join(final_content).strip() or "[No output from LLM]"
+        result_str = buf.getvalue().strip() or NO_OUTPUT
 
         if self.mediator:
             self.mediator.notify(
@@ -164,83 +185,126 @@ class SuperJudge(JudgeBase, Mediator):
     A "judge of judges." This class:
       - Inherits from JudgeBase (so it's also a judge).
       - Orchestrates sub-judges (Mediator-like).
-      - Collects their outputs in a final verdict.
+      - Collects their outputs in a final verdict, and can stream them as they arrive.
       - Shares the kernel as needed if it wants to do any final summary or evaluation.
 
-    You can override evaluate() to define how it runs sub-judges in parallel or in a plan.
+    You can override evaluate() to define how it runs sub-judges (in parallel by default).
+    At most MAX_INFLIGHT_JUDGES sub-judges call their model at the same time across every
+    SuperJudge of the process, so concurrent requests do not burst past the deployment's rate
+    limits. Pass `max_inflight` to give a SuperJudge its own limit instead.
+    Only leaf judges take a slot: a nested SuperJudge holding one while its own sub-judges wait
+    for the rest could exhaust the limit and deadlock.
     """
 
-    def __init__(self, kernel: sk.Kernel, name: str = "SuperJudge") -> None:
+    _shared_sem: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+    def __init__(
+        self, kernel: sk.Kernel, name: str = "SuperJudge", max_inflight: Optional[int] = None
+    ) -> None:
         super().__init__()
         self.kernel = kernel
         self.name = name
+        self._sem = asyncio.Semaphore(max_inflight) if max_inflight is not None else None
         self._judges: List[JudgeBase] = []
-        self._evaluations: List[dict] = []
+        self._positions: Dict[JudgeBase, List[int]] = {}
+        self._verdict_parts: List[Optional[str]] = []
+        self._verdict: Optional[str] = None
+        self._queue: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+
+    @classmethod
+    def shared_semaphore(cls) -> asyncio.Semaphore:
+        """
+        Return the process-wide semaphore holding MAX_INFLIGHT_JUDGES slots.
+        A semaphore belongs to one event loop, so it is rebuilt if the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._shared_sem is None or cls._shared_sem[0] is not loop:
+            cls._shared_sem = (loop, asyncio.Semaphore(MAX_INFLIGHT_JUDGES))
+        return cls._shared_sem[1]
 
     def register_judge(self, judge: JudgeBase) -> None:
         """
         Register a sub-judge for orchestration.
+        Each registration reserves a slot in the evaluations, so the final verdict follows
+        registration order rather than completion order.
+        The same judge may be registered more than once (e.g. duplicated for voting); it is
+        evaluated once and its result fills every slot it was registered in.
         """
+        self._positions.setdefault(judge, []).append(len(self._judges))
         self._judges.append(judge)
+        self._verdict_parts.append(None)
+        self._verdict = None
         judge.mediator = self  # so sub-judges can notify us
 
     def notify(self, sender: object, event: str, data: dict) -> None:
         """
         Called by sub-judges upon completion of their evaluation.
+        The verdict line is formatted once here, so final_verdict only has to join them.
         """
         if event == "evaluation_done":
-            self._evaluations.append(data)
+            part = f"{data['judge_name']} => {data['result']}"
+            for index in self._positions.get(sender, ()):
+                self._verdict_parts[index] = part
+                self._queue.put_nowait(data)
+            self._verdict = None
 
     def final_verdict(self) -> str:
         """
-        Combine sub-judges' evaluations.
+        Combine sub-judges' evaluations, in registration order.
+        The result is memoized until another evaluation arrives.
         """
-        if not self._evaluations:
-            return "[No evaluations received]"
-        lines = []
-        for ev in self._evaluations:
-            lines.append(f"{ev['judge_name']} => {ev['result']}")
-        return "\n".join(lines)
+        if self._verdict is None:
+            parts = [part for part in self._verdict_parts if part is not None]
+            self._verdict = "\n".join(parts) if parts else NO_EVALUATIONS
+        return self._verdict
 
     async def evaluate(self, prompt: str) -> None:
         """
         Because SuperJudge is also a Judge, we can define an evaluation flow:
-          - We can run sub-judges in parallel or in a plan.
+          - Evaluate all distinct sub-judges in parallel, within the in-flight limit.
           - Then we might do a final step using self.kernel if we want.
         """
-        # For demonstration, we'll define a Plan that runs each sub-judge's evaluation
-        plan = JudgeEvaluationPlan(super_judge=self, prompt=prompt)
-        await plan.run_plan()
-
-
-class JudgeEvaluationPlan(Plan):
-    """
-    A semantic-kernel Plan describing how the SuperJudge calls each sub-judge.
-    Could contain complex logic (sequential, parallel, branching, etc.).
-    For simplicity, we'll run them in parallel.
-    """
-
-    def __init__(self, super_judge: SuperJudge, prompt: str):
-        super().__init__(
-            name="JudgeEvaluationPlan", description="Plan for orchestrating sub-judges."
-        )
-        self.super_judge = super_judge
-        self.prompt = prompt
-
-    async def run_plan(self) -> Any:
-        """
-        Execute the plan:
-         - Evaluate all sub-judges in parallel
-         - Return final verdict
+        sem = self._sem or SuperJudge.shared_semaphore()
+
+        async def _bounded(judge: JudgeBase) -> None:
+            if isinstance(judge, SuperJudge):
+                # Its sub-judges acquire their own slots
+                await judge.evaluate(prompt)
+                return
+            async with sem:
+                await judge.evaluate(prompt)
+
+        # Duplicated registrations share a single evaluation. The TaskGroup cancels the
+        # remaining sub-judges as soon as one of them fails, and we surface that failure
+        # itself rather than the ExceptionGroup wrapping it. Sub-judges that failed at the
+        # same time are logged, since only the first error is raised.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for judge in dict.fromkeys(self._judges):
+                    tg.create_task(_bounded(judge))
+        except ExceptionGroup as eg:
+            for exc in eg.exceptions[1:]:
+                logger.error("%s: another sub-judge failed", self.name, exc_info=exc)
+            raise eg.exceptions[0] from None
+
+    async def stream(self, prompt: str) -> AsyncIterator[Tuple[str, dict]]:
         """
-        # 1) Run all sub-judges in parallel
-        await asyncio.gather(*(j.evaluate(self.prompt) for j in self.super_judge._judges))
+        Evaluate the prompt and yield each sub-judge's evaluation as soon as it arrives.
 
-        # 2) (Optionally) SuperJudge can do a final summary with self.super_judge.kernel
-        # if desired. For now, we skip it.
+        Yields ("evaluation", data) once per sub-judge result, in completion order, and
+        finally ("verdict", {"result": final_verdict}). If the consumer stops early, the
+        pending sub-judges are cancelled.
+        """
+        task = asyncio.create_task(self.evaluate(prompt))
+        task.add_done_callback(lambda _: self._queue.put_nowait(None))
+        try:
+            while (data := await self._queue.get()) is not None:
+                yield "evaluation", data
+            await task
+        finally:
+            task.cancel()
 
-        # 3) Return final verdict
-        return self.super_judge.final_verdict()
+        yield "verdict", {"result": self.final_verdict()}
 
 
 class JudgeFactory:
@@ -264,9 +328,179 @@ class JudgeFactory:
     def create_judges(assembly: Assembly, kernel: sk.Kernel) -> List[ConcreteJudge]:
         """
         Produce a list of ConcreteJudge objects from Pydantic Judge models.
-        Each judge uses the provided kernel for its ChatCompletionAgent.
+        Each judge uses the provided kernel for its ChatCompletionAgent, which is built here,
+        at Assembly-load time, rather than once per evaluated prompt.
+
+        Identical entries (same model, metaprompt and name) share one ConcreteJudge instance,
+        so the SuperJudge issues a single LLM call for all of them. Execution settings are
+        resolved once per distinct model.
+        """
+        settings: Dict[str, PromptExecutionSettings] = {}
+        unique: Dict[bytes, ConcreteJudge] = {}
+        judges = []
+        for jd in assembly.judges:
+            fingerprint = JudgeFactory.fingerprint(jd)
+            if fingerprint not in unique:
+                model = str(jd.model)
+                if model not in settings:
+                    settings[model] = ConcreteJudge.resolve_settings(kernel, model)
+                unique[fingerprint] = ConcreteJudge(
+                    judge_data=jd, kernel=kernel, settings=settings[model]
+                )
+            judges.append(unique[fingerprint])
+        return judges
+
+    @staticmethod
+    def fingerprint(judge_data: Judge) -> bytes:
+        """
+        Identify judges that would send the exact same request to the same model.
+        """
+        key = "\0".join((str(judge_data.model), judge_data.metaprompt, judge_data.name))
+        return hashlib.blake2b(key.encode()).digest()
+
+
+def assembly_version(assembly: Assembly) -> str:
+    """
+    Hash the content of an Assembly, so cached verdicts of an edited Assembly no longer match.
+    """
+    return hashlib.blake2b(assembly.model_dump_json().encode(), digest_size=16).hexdigest()
+
+
+class VerdictCache:
+    """
+    An in-process LRU cache of final verdicts.
+
+    Entries are keyed by the Assembly ID, its version and a BLAKE2b hash of the prompt, so an
+    identical prompt sent to the same Assembly is answered without calling any sub-judge.
+    The version is a hash of the Assembly's content (see `assembly_version()`), so a worker
+    whose copy was not invalidated never serves a verdict of an outdated Assembly.
+    Every entry of an Assembly can be dropped at once with `invalidate()`.
+    """
+
+    def __init__(self, maxsize: int = VERDICT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._verdicts: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def key(assembly_id: str, version: str, prompt: str) -> str:
+        """
+        Build the cache key for a prompt evaluated by a version of an Assembly.
+        """
+        return f"{assembly_id}:{version}:{hashlib.blake2b(prompt.encode()).hexdigest()}"
+
+    def get(self, assembly_id: str, version: str, prompt: str) -> Optional[str]:
+        """
+        Return the cached verdict, or None on a miss.
+        """
+        key = self.key(assembly_id, version, prompt)
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+        return verdict
+
+    def set(self, assembly_id: str, version: str, prompt: str, verdict: str) -> None:
+        """
+        Store a verdict, evicting the least recently used entry when full.
+        """
+        key = self.key(assembly_id, version, prompt)
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > self.maxsize:
+            self._verdicts.popitem(last=False)
+
+    def invalidate(self, assembly_id: str) -> None:
+        """
+        Drop every verdict cached for an Assembly.
+        """
+        prefix = f"{assembly_id}:"
+        for key in [k for k in self._verdicts if k.startswith(prefix)]:
+            del self._verdicts[key]
+
+    def clear(self) -> None:
+        """
+        Drop every cached verdict.
+        """
+        self._verdicts.clear()
+
+
+class SemanticVerdictCache:
+    """
+    An optional cache that reuses a verdict when a new prompt is close enough to a previous one.
+
+    Prompts are embedded with the provided `embed` coroutine (e.g. an Azure OpenAI
+    text-embedding-3-small deployment) and L2-normalized, so the top-1 cosine similarity
+    against the Assembly's cached prompts is a single matrix-vector product. A hit requires
+    a similarity of at least `threshold`.
+
+    Cached embeddings are quantized to int8 (a quarter of the float32 size); the incoming
+    prompt is kept in float32, so the rounding error stays well below the threshold margin.
+
+    Only the entries of the latest version of each Assembly are kept.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[Sequence[float]]],
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        maxsize: int = VERDICT_CACHE_SIZE,
+    ) -> None:
+        self._embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[str, np.ndarray, List[str]]] = {}
+
+    @staticmethod
+    def quantize(embedding: np.ndarray) -> np.ndarray:
+        """
+        Scale a normalized embedding to the int8 range.
         """
-        return [ConcreteJudge(judge_data=jd, kernel=kernel) for jd in assembly.judges]
+        return np.clip(np.round(embedding * 127), -127, 127).astype(np.int8)
+
+    async def embed(self, prompt: str) -> np.ndarray:
+        """
+        Embed a prompt and L2-normalize the vector.
+        """
+        vector = np.asarray(await self._embed(prompt), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, assembly_id: str, version: str, embedding: np.ndarray) -> Optional[str]:
+        """
+        Return the verdict of the most similar cached prompt, or None below the threshold.
+        """
+        cached_version, vectors, verdicts = self._entries.get(assembly_id, (None, None, None))
+        if cached_version != version:
+            return None
+        # Accumulate in float32 without materializing a float32 copy of the int8 vectors
+        scores = np.einsum("ij,j->i", vectors, embedding, dtype=np.float32)
+        best = int(np.argmax(scores))
+        return verdicts[best] if scores[best] >= self.threshold * 127 else None
+
+    def set(self, assembly_id: str, version: str, embedding: np.ndarray, verdict: str) -> None:
+        """
+        Store a verdict, dropping the oldest entries of the Assembly when full and every entry
+        of its previous versions.
+        """
+        quantized = SemanticVerdictCache.quantize(embedding)
+        cached_version, vectors, verdicts = self._entries.get(assembly_id, (None, None, None))
+        if cached_version == version:
+            vectors = np.vstack([vectors, quantized])[-self.maxsize :]
+            verdicts = (verdicts + [verdict])[-self.maxsize :]
+        else:
+            vectors, verdicts = quantized[np.newaxis, :], [verdict]
+        self._entries[assembly_id] = (version, vectors, verdicts)
+
+    def invalidate(self, assembly_id: str) -> None:
+        """
+        Drop every verdict cached for an Assembly.
+        """
+        self._entries.pop(assembly_id, None)
+
+    def clear(self) -> None:
+        """
+        Drop every cached verdict.
+        """
+        self._entries.clear()
 
 
 class JudgeOrchestrator:
@@ -274,17 +508,68 @@ class JudgeOrchestrator:
     A high-level class that merges the SuperJudge and JudgeFactory in one evaluation procedure.
     - You give it an Assembly (list of Pydantic Judge entries).
     - It builds a kernel, a SuperJudge, sub-judges, and orchestrates an evaluation.
+    - Verdicts are cached per Assembly; set `semantic_cache` to also reuse verdicts of
+      near-identical prompts.
     """
 
+    verdict_cache: VerdictCache = VerdictCache()
+    semantic_cache: Optional[SemanticVerdictCache] = None
+
     @staticmethod
     async def run_evaluation(assembly: Assembly, prompt: str) -> str:
         """
+        0) Return a cached verdict if the Assembly already judged this prompt
         1) Build a shared kernel
         2) Instantiate a SuperJudge referencing that kernel
         3) Create sub-judges via JudgeFactory
         4) Register them in the SuperJudge
-        5) Let the SuperJudge evaluate (which calls sub-judges in a plan)
-        6) Return the final verdict
+        5) Let the SuperJudge evaluate (which calls sub-judges in parallel)
+        6) Cache and return the final verdict
+        """
+        # 0) Verdict caches
+        version = assembly_version(assembly)
+        verdict, embedding = await JudgeOrchestrator._cached_verdict(assembly.id, version, prompt)
+        if verdict is not None:
+            return verdict
+
+        # 1-4) SuperJudge and its sub-judges
+        super_judge = JudgeOrchestrator._build_super_judge(assembly)
+
+        # 5) Evaluate
+        await super_judge.evaluate(prompt)
+
+        # 6) Final verdict
+        verdict = super_judge.final_verdict()
+        JudgeOrchestrator._cache_verdict(assembly.id, version, prompt, embedding, verdict)
+        return verdict
+
+    @staticmethod
+    async def run_evaluation_stream(
+        assembly: Assembly, prompt: str
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Streaming variant of run_evaluation().
+        Yields ("evaluation", data) for each sub-judge as it finishes, then
+        ("verdict", {"result": ...}). A cached verdict is yielded on its own.
+        """
+        version = assembly_version(assembly)
+        verdict, embedding = await JudgeOrchestrator._cached_verdict(assembly.id, version, prompt)
+        if verdict is not None:
+            yield "verdict", {"result": verdict}
+            return
+
+        super_judge = JudgeOrchestrator._build_super_judge(assembly)
+        async for event, data in super_judge.stream(prompt):
+            if event == "verdict":
+                JudgeOrchestrator._cache_verdict(
+                    assembly.id, version, prompt, embedding, data["result"]
+                )
+            yield event, data
+
+    @staticmethod
+    def _build_super_judge(assembly: Assembly) -> SuperJudge:
+        """
+        Build the shared kernel, the SuperJudge and its registered sub-judges.
         """
         # 1) Shared kernel
         kernel = JudgeFactory.build_kernel()
@@ -299,29 +584,64 @@ class JudgeOrchestrator:
         for j in sub_judges:
             super_judge.register_judge(j)
 
-        # 5) Evaluate
-        await super_judge.evaluate(prompt)
+        return super_judge
 
-        # 6) Final verdict
-        return super_judge.final_verdict()
+    @staticmethod
+    async def _cached_verdict(
+        assembly_id: str, version: str, prompt: str
+    ) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """
+        Look the prompt up in the verdict caches, for the given version of an Assembly.
+        Returns the cached verdict (or None) and the prompt embedding, when semantic caching
+        is enabled, so a miss can be stored without embedding the prompt twice.
+        """
+        verdict = JudgeOrchestrator.verdict_cache.get(assembly_id, version, prompt)
+        if verdict is not None:
+            return verdict, None
+
+        embedding = None
+        if JudgeOrchestrator.semantic_cache is not None:
+            embedding = await JudgeOrchestrator.semantic_cache.embed(prompt)
+            verdict = JudgeOrchestrator.semantic_cache.get(assembly_id, version, embedding)
+        return verdict, embedding
+
+    @staticmethod
+    def _cache_verdict(
+        assembly_id: str,
+        version: str,
+        prompt: str,
+        embedding: Optional[np.ndarray],
+        verdict: str,
+    ) -> None:
+        """
+        Store a freshly computed verdict in the verdict caches.
+        Verdicts with a placeholder instead of a sub-judge's answer are not stored, so the
+        next request retries the sub-judges.
+        """
+        if verdict == NO_EVALUATIONS or NO_OUTPUT in verdict:
+            return
+        JudgeOrchestrator.verdict_cache.set(assembly_id, version, prompt, verdict)
+        if embedding is not None and JudgeOrchestrator.semantic_cache is not None:
+            JudgeOrchestrator.semantic_cache.set(assembly_id, version, embedding, verdict)
+
+    @staticmethod
+    def invalidate(assembly_id: str) -> None:
+        """
+        Forget every cached verdict of an Assembly, e.g. after it was updated or deleted.
+        """
+        JudgeOrchestrator.verdict_cache.invalidate(assembly_id)
+        if JudgeOrchestrator.semantic_cache is not None:
+            JudgeOrchestrator.semantic_cache.invalidate(assembly_id)
 
 
-async def fetch_assembly(assembly_id: str) -> dict | None:
+async def fetch_assembly(container: ContainerProxy, assembly_id: str) -> dict | None:
     """
     Helper function to fetch an Assembly document from Cosmos DB by its ID.
+    The container is the shared assemblies container opened once at application startup.
     Returns the document as a dict, or None if not found.
     """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as client:
-        try:
-            database = client.get_database_client(COSMOS_DB_NAME)
-            # Confirm the database exists.
-            await database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            return None
-
-        container = database.get_container_client(COSMOS_ASSEMBLY_TABLE)
-        try:
-            item = await container.read_item(item=assembly_id, partition_key=assembly_id)
-            return item
-        except exceptions.CosmosResourceNotFoundError:
-            return None
+    try:
+        item = await container.read_item(item=assembly_id, partition_key=assembly_id)
+        return item
+    except exceptions.CosmosResourceNotFoundError:
+        return None
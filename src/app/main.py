@@ -2,21 +2,26 @@
 The configuration for the mailing service.
 """
 
+import asyncio
 import csv
 import logging
 import os
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlsplit
+from uuid import uuid4
 
+import orjson
 from azure.cosmos import exceptions
-from azure.cosmos.aio import CosmosClient
+from azure.cosmos.aio import ContainerProxy, CosmosClient
 from azure.identity.aio import DefaultAzureCredential
 from dotenv import find_dotenv, load_dotenv
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import ValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 
 from app import __app__, __version__
 from app.judges import JudgeOrchestrator, fetch_assembly
@@ -29,6 +34,29 @@ MODEL_URL: str = os.environ.get("GPT4_URL", "")
 MODEL_KEY: str = os.environ.get("GPT4_KEY", "")
 MONITOR: str = os.environ.get("AZ_CONNECTION_LOG", "")
 COSMOS_ENDPOINT = os.getenv("COSMOS_ENDPOINT", "")
+COSMOS_DB_NAME = os.getenv("COSMOS_DB_NAME", "")
+COSMOS_JUDGE_TABLE = os.getenv("COSMOS_JUDGE_TABLE", "")
+COSMOS_ASSEMBLY_TABLE = os.getenv("COSMOS_ASSEMBLY_TABLE", "")
+# The scope the Cosmos DB client requests tokens for: the account endpoint itself.
+COSMOS_SCOPE = "{0.scheme}://{0.hostname}/.default".format(urlsplit(COSMOS_ENDPOINT))
+
+# Constant, fully parameterized queries: an empty parameter disables its filter.
+JUDGES_QUERY = (
+    "SELECT * FROM c"
+    " WHERE (@name = '' OR CONTAINS(c.name, @name, true))"
+    " AND (@email = '' OR CONTAINS(c.email, @email, true))"
+)
+# Background evaluation records share the assemblies container and are left out by `task_id`.
+ASSEMBLIES_QUERY = (
+    "SELECT * FROM c"
+    " WHERE NOT IS_DEFINED(c.task_id)"
+    " AND (@role = '' OR ARRAY_CONTAINS(c.roles, @role))"
+)
+QUERY_PAGE_SIZE = 100
+# Background evaluations a worker runs at once; further requests are answered 429.
+MAX_RUNNING_EVALUATIONS = int(os.getenv("MAX_RUNNING_EVALUATIONS", "64"))
+# Seconds an evaluation record is kept, when the container has time-to-live enabled.
+EVALUATION_RECORD_TTL = int(os.getenv("EVALUATION_RECORD_TTL", "86400"))
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
@@ -62,6 +90,48 @@ The service is responsible for managing the agents and the orchestration of the
 """
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # pylint: disable=redefined-outer-name
+    """
+    lifespan Opens the Cosmos DB resources shared by every request.
+
+    A single credential and client are created on startup, so the token acquisition and the
+    connection setup are paid once per process instead of once per request. The token is
+    acquired eagerly, so the first request does not pay for the credential chain walk. The database is
+    checked (and created if missing) only here, and the container proxies are cached on
+    `app.state`, so the endpoints go straight to their item operations. Background evaluations
+    still running at shutdown are cancelled, and their records marked as such, before the
+    client is closed.
+
+    Args:
+        app (FastAPI): the application being started
+
+    Yields:
+        None: control back to FastAPI while the application is serving requests.
+    """
+    credential = DefaultAzureCredential(exclude_visual_studio_code_credential=True)
+    cosmos = CosmosClient(COSMOS_ENDPOINT, credential)
+    try:
+        # Walk the credential chain and cache the Cosmos DB token before the first request.
+        await credential.get_token(COSMOS_SCOPE)
+        database = await cosmos.create_database_if_not_exists(COSMOS_DB_NAME)
+
+        app.state.credential = credential
+        app.state.cosmos = cosmos
+        app.state.database = database
+        app.state.judges_container = database.get_container_client(COSMOS_JUDGE_TABLE)
+        app.state.assemblies_container = database.get_container_client(COSMOS_ASSEMBLY_TABLE)
+        app.state.evaluation_tasks = set()
+        yield
+    finally:
+        tasks = getattr(app.state, "evaluation_tasks", set())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await cosmos.close()
+        await credential.close()
+
+
 app: FastAPI = FastAPI(
     title=__app__,
     version=__version__,
@@ -69,6 +139,8 @@ app: FastAPI = FastAPI(
     openapi_tags=tags_metadata,
     openapi_url="/api/v1/openapi.json",
     responses=RESPONSES,  # type: ignore
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -83,7 +155,7 @@ app.add_middleware(
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError  # pylint: disable=unused-argument
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     validation_exception_handler Exception handler for validations.
 
@@ -92,7 +164,7 @@ async def validation_exception_handler(
         exc (RequestValidationError): the validation raised by the process
 
     Returns:
-        JSONResponse: A json encoded response with the validation errors.
+        ORJSONResponse: A json encoded response with the validation errors.
     """
 
     response_body: ErrorMessage = ErrorMessage(
@@ -102,7 +174,7 @@ async def validation_exception_handler(
         detail={"invalid-params": list(exc.errors())},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content=jsonable_encoder(response_body),
     )
@@ -111,7 +183,7 @@ async def validation_exception_handler(
 @app.exception_handler(ResponseValidationError)
 async def response_exception_handler(
     request: Request, exc: ResponseValidationError  # pylint: disable=unused-argument
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     response_exception_handler Exception handler for response validations.
 
@@ -120,7 +192,7 @@ async def response_exception_handler(
         exc (RequestValidationError): the validation raised by the process
 
     Returns:
-        JSONResponse: A json encoded response with the validation errors.
+        ORJSONResponse: A json encoded response with the validation errors.
     """
 
     response_body: ErrorMessage = ErrorMessage(
@@ -130,212 +202,236 @@ async def response_exception_handler(
         detail={"invalid-params": list(exc.errors())},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content=jsonable_encoder(response_body),
     )
 
 
+def patch_operations(document: BaseModel) -> List[Dict[str, Any]]:
+    """
+    patch_operations Builds the Cosmos DB partial document update for a request body.
+
+    Every field is written with a `set` operation, so the item is updated in a single
+    server-side call. The `id` is immutable in Cosmos DB and is left out.
+
+    Args:
+        document (BaseModel): the validated request body
+
+    Returns:
+        List[Dict[str, Any]]: the JSON Patch operations for `patch_item`.
+    """
+    return [
+        {"op": "set", "path": f"/{key}", "value": value}
+        for key, value in document.model_dump(mode="json", exclude={"id"}).items()
+    ]
+
+
+async def fetch_first_page(pages: AsyncIterator) -> list:
+    """
+    fetch_first_page Reads the first page of a Cosmos DB query.
+
+    Awaited before a StreamingResponse is returned, so a failing query is reported with an
+    error status instead of a truncated 200 response.
+
+    Args:
+        pages (AsyncIterator): the pages of a query, as returned by `by_page()`
+
+    Returns:
+        list: the items of the first page, empty if the query has no results.
+    """
+    async for page in pages:
+        return [item async for item in page]
+    return []
+
+
+async def stream_success(
+    first_page: list, pages: AsyncIterator, title: str, message: str
+) -> AsyncIterator[bytes]:
+    """
+    stream_success Streams the pages of a Cosmos DB query as a SuccessMessage JSON body.
+
+    The `content` array is written one page at a time, so only a single page is held in
+    memory. The `title` reports how many items were found, so it is written last.
+
+    Args:
+        first_page (list): the items of the first page, from `fetch_first_page()`
+        pages (AsyncIterator): the remaining pages of the query
+        title (str): the response title, with a `{count}` placeholder
+        message (str): the response message
+
+    Yields:
+        bytes: consecutive fragments of the JSON response body.
+    """
+    count = len(first_page)
+    yield (
+        b'{"message":'
+        + orjson.dumps(message)
+        + b',"content":['
+        + b",".join(orjson.dumps(item) for item in first_page)
+    )
+    async for page in pages:
+        items = [orjson.dumps(item) async for item in page]
+        if items:
+            yield (b"," if count else b"") + b",".join(items)
+            count += len(items)
+    yield b'],"title":' + orjson.dumps(title.format(count=count)) + b"}"
+
+
 @app.get("/list-judges", tags=["Judge Configuration"])
-async def list_judges(name: Optional[str] = None, email: Optional[str] = None) -> JSONResponse:
+async def list_judges(
+    request: Request, name: Optional[str] = None, email: Optional[str] = None
+) -> StreamingResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as client:
-        try:
-            database = client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            client.create_database(os.getenv("COSMOS_DB_NAME", ""))
-        container = database.get_container_client(os.getenv("COSMOS_JUDGE_TABLE", ""))
-        query = "SELECT * FROM judges"
-        parameters = []
-        if name:
-            query += " WHERE judges.name LIKE @judge_name"
-            parameters.append({"name": "@judge_name", "value": f"%{name}%"})
-        if email:
-            if "WHERE" in query:
-                query += " OR judges.email LIKE @judge_email"
-            else:
-                query += " WHERE judges.email LIKE @judge_email"
-            parameters.append({"name": "@judge_email", "value": f"%{email}%"})
-        judges = [item async for item in container.query_items(query=query, parameters=parameters)]
-    response_body: SuccessMessage = SuccessMessage(
-        title=f"{len(judges)} Judges Retrieved",
-        message="Successfully retrieved judge data from the database.",
-        content=judges,
+    container = request.app.state.judges_container
+    parameters = [
+        {"name": "@name", "value": name or ""},
+        {"name": "@email", "value": email or ""},
+    ]
+    pages = container.query_items(
+        query=JUDGES_QUERY, parameters=parameters, max_item_count=QUERY_PAGE_SIZE
+    ).by_page()
+    first_page = await fetch_first_page(pages)
+    return StreamingResponse(
+        stream_success(
+            first_page,
+            pages,
+            title="{count} Judges Retrieved",
+            message="Successfully retrieved judge data from the database.",
+        ),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
 
 
 @app.post("/create-judge", tags=["Judge Configuration"])
-async def create_judge(judge: Judge) -> JSONResponse:
+async def create_judge(request: Request, judge: Judge) -> ORJSONResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as cosmos_client:
-        try:
-            database = cosmos_client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            cosmos_client.create_database(os.getenv("COSMOS_DB_NAME", ""))
-        container = database.get_container_client(os.getenv("COSMOS_JUDGE_TABLE", ""))
-        await container.upsert_item(judge.model_dump())
+    container = request.app.state.judges_container
+    document = judge.model_dump(mode="json")
+    await container.upsert_item(document)
     response_body: SuccessMessage = SuccessMessage(
         title=f"Judge {judge.name} Created",
         message="Judge created and ready for usage.",
-        content=judge.model_dump(),
+        content=document,
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
 
 
 @app.put("/update-judge/{judge_id}", tags=["Judge Configuration"])
-async def update_judge(judge_id: str, judge: Judge) -> JSONResponse:
+async def update_judge(request: Request, judge_id: str, judge: Judge) -> ORJSONResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as cosmos_client:
-        try:
-            database = cosmos_client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Database not found.")
-
-        container = database.get_container_client(os.getenv("COSMOS_JUDGE_TABLE", ""))
-        try:
-            existing_client = await container.read_item(item=judge_id, partition_key=judge_id)
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Judge not found.")
-
-        updated_judge = {**existing_client, **judge.model_dump()}
-        await container.replace_item(item=judge_id, body=updated_judge)
+    container = request.app.state.judges_container
+    try:
+        updated_judge = await container.patch_item(
+            item=judge_id, partition_key=judge_id, patch_operations=patch_operations(judge)
+        )
+    except exceptions.CosmosResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Judge not found.")
 
     response_body: SuccessMessage = SuccessMessage(
         title=f"Judge {judge.name} Updated",
         message="Judge data has been updated successfully.",
         content=updated_judge,
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
 
 
 @app.delete("/delete-judge/{judge_id}", tags=["Judge Configuration"])
-async def delete_judge(judge_id: str) -> JSONResponse:
+async def delete_judge(request: Request, judge_id: str) -> ORJSONResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as cosmos_client:
-        try:
-            database = cosmos_client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Database not found.")
-
-        container = database.get_container_client(os.getenv("COSMOS_JUDGE_TABLE", ""))
-        try:
-            await container.delete_item(item=judge_id, partition_key=judge_id)
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Judge not found.")
+    container = request.app.state.judges_container
+    try:
+        await container.delete_item(item=judge_id, partition_key=judge_id)
+    except exceptions.CosmosResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Judge not found.")
 
     response_body: SuccessMessage = SuccessMessage(
         title=f"Judge {judge_id} Deleted",
         message="Judge has been deleted successfully.",
         content={"judge_id": judge_id},
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
 
 
 @app.get("/list-assemblies", tags=["Judge Configuration"])
-async def list_assemblies(role: Optional[str] = None) -> JSONResponse:
+async def list_assemblies(request: Request, role: Optional[str] = None) -> StreamingResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as client:
-        try:
-            database = client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            client.create_database(os.getenv("COSMOS_DB_NAME", ""))
-        container = database.get_container_client(os.getenv("COSMOS_ASSEMBLY_TABLE", ""))
-        query = "SELECT * FROM c"
-        parameters = []
-        if role:
-            query += " WHERE c.roles LIKE @role"
-            parameters.append({"name": "@role", "value": f"%{role}%"})
-        assemblies = [
-            item async for item in container.query_items(query=query, parameters=parameters)
-        ]
-    response_body: SuccessMessage = SuccessMessage(
-        title=f"{len(assemblies)} Assemblies Retrieved",
-        message="Successfully retrieved assemblies with proper filter.",
-        content=assemblies,
+    container = request.app.state.assemblies_container
+    parameters = [{"name": "@role", "value": role or ""}]
+    pages = container.query_items(
+        query=ASSEMBLIES_QUERY, parameters=parameters, max_item_count=QUERY_PAGE_SIZE
+    ).by_page()
+    first_page = await fetch_first_page(pages)
+    return StreamingResponse(
+        stream_success(
+            first_page,
+            pages,
+            title="{count} Assemblies Retrieved",
+            message="Successfully retrieved assemblies with proper filter.",
+        ),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
 
 
 @app.post("/create-assembly", tags=["Judge Configuration"])
-async def create_assembly(assembly: Assembly) -> JSONResponse:
+async def create_assembly(request: Request, assembly: Assembly) -> ORJSONResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as cosmos_client:
-        try:
-            database = cosmos_client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            cosmos_client.create_database(os.getenv("COSMOS_DB_NAME", ""))
-        container = database.get_container_client(os.getenv("COSMOS_ASSEMBLY_TABLE", ""))
-        await container.upsert_item(assembly.model_dump())
+    container = request.app.state.assemblies_container
+    document = assembly.model_dump(mode="json")
+    await container.upsert_item(document)
+    JudgeOrchestrator.invalidate(assembly.id)
     response_body: SuccessMessage = SuccessMessage(
         title="Email Created",
         message="Email content has been created successfully.",
-        content=assembly.model_dump(),
+        content=document,
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
 
 
 @app.put("/update-assembly/{assembly_id}", tags=["Judge Configuration"])
-async def update_assembly(assembly_id: str, assembly: Assembly) -> JSONResponse:
+async def update_assembly(request: Request, assembly_id: str, assembly: Assembly) -> ORJSONResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as cosmos_client:
-        try:
-            database = cosmos_client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Database not found.")
-
-        container = database.get_container_client(os.getenv("COSMOS_ASSEMBLY_TABLE", ""))
-        try:
-            existing_assembly = await container.read_item(
-                item=assembly_id, partition_key=assembly_id
-            )
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Assembly not found.")
-
-        updated_assembly = {**existing_assembly, **assembly.model_dump()}
-        await container.replace_item(item=assembly_id, body=updated_assembly)
+    container = request.app.state.assemblies_container
+    try:
+        updated_assembly = await container.patch_item(
+            item=assembly_id,
+            partition_key=assembly_id,
+            patch_operations=patch_operations(assembly),
+        )
+    except exceptions.CosmosResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Assembly not found.")
+    JudgeOrchestrator.invalidate(assembly_id)
 
     response_body: SuccessMessage = SuccessMessage(
         title=f"Assembly {assembly_id} Updated",
         message="Assembly content has been updated successfully.",
         content=updated_assembly,
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
 
 
 @app.delete("/delete-assembly/{assembly_id}", tags=["Judge Configuration"])
-async def delete_email(assembly_id: str) -> JSONResponse:
+async def delete_email(request: Request, assembly_id: str) -> ORJSONResponse:
     """ """
-    async with CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential()) as cosmos_client:
-        try:
-            database = cosmos_client.get_database_client(os.getenv("COSMOS_DB_NAME", ""))
-            database.read()
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Database not found.")
-
-        container = database.get_container_client(os.getenv("COSMOS_ASSEMBLY_TABLE", ""))
-        try:
-            await container.delete_item(item=assembly_id, partition_key=assembly_id)
-        except exceptions.CosmosResourceNotFoundError:
-            raise HTTPException(status_code=404, detail="Email not found.")
+    container = request.app.state.assemblies_container
+    try:
+        await container.delete_item(item=assembly_id, partition_key=assembly_id)
+    except exceptions.CosmosResourceNotFoundError:
+        raise HTTPException(status_code=404, detail="Email not found.")
+    JudgeOrchestrator.invalidate(assembly_id)
 
     response_body: SuccessMessage = SuccessMessage(
         title=f"Email {assembly_id} Deleted",
         message="Email content has been deleted successfully.",
         content={"email_id": assembly_id},
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
 
 
 @app.post("/evaluate", tags=["Judge Execution"])
-async def evaluate_judgment(evaluation: JudgeEvaluation) -> JSONResponse:
+async def evaluate_judgment(request: Request, evaluation: JudgeEvaluation) -> ORJSONResponse:
     """
     Endpoint that evaluates a prompt using a Judge Assembly.
 
@@ -346,10 +442,10 @@ async def evaluate_judgment(evaluation: JudgeEvaluation) -> JSONResponse:
            - Build a shared Kernel.
            - Create a SuperJudge and individual ConcreteJudge agents.
            - Register all sub-judges with the SuperJudge.
-           - Run the evaluation (the SuperJudge invokes its plan to run all sub-judges).
+           - Run the evaluation (the SuperJudge runs all sub-judges in parallel).
       4. Return the final aggregated verdict as a JSON response.
     """
-    assembly_doc = await fetch_assembly(evaluation.id)
+    assembly_doc = await fetch_assembly(request.app.state.assemblies_container, evaluation.id)
     if not assembly_doc:
         raise HTTPException(status_code=404, detail=f"Assembly '{evaluation.id}' not found.")
 
@@ -366,4 +462,167 @@ async def evaluate_judgment(evaluation: JudgeEvaluation) -> JSONResponse:
         message="Judging completed successfully.",
         content={"assembly_id": evaluation.id, "result": final_verdict},
     )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=jsonable_encoder(response_body))
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+
+
+@app.post("/evaluate-stream", tags=["Judge Execution"])
+async def evaluate_judgment_stream(
+    request: Request, evaluation: JudgeEvaluation
+) -> StreamingResponse:
+    """
+    Endpoint that evaluates a prompt using a Judge Assembly and streams the results.
+
+    Follows the same process as `/evaluate`, but answers with Server-Sent Events:
+      - an `evaluation` event as soon as each sub-judge finishes,
+      - a final `verdict` event with the aggregated verdict,
+      - or an `error` event if the evaluation fails midway.
+    Clients see the first result after a single judge's latency instead of the slowest one's.
+    """
+    assembly_doc = await fetch_assembly(request.app.state.assemblies_container, evaluation.id)
+    if not assembly_doc:
+        raise HTTPException(status_code=404, detail=f"Assembly '{evaluation.id}' not found.")
+
+    assembly = Assembly(**assembly_doc)
+
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            async for event, data in JudgeOrchestrator.run_evaluation_stream(
+                assembly, evaluation.prompt
+            ):
+                if event == "verdict":
+                    data = {"assembly_id": evaluation.id, **data}
+                yield b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            yield b"event: error\ndata: " + orjson.dumps({"detail": str(ex)}) + b"\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+async def save_evaluation_record(container: ContainerProxy, record: Dict[str, Any]) -> None:
+    """
+    save_evaluation_record Writes the state of a background evaluation to Cosmos DB.
+
+    Failures are logged rather than raised, so a background task never ends with an
+    exception nobody retrieves.
+
+    Args:
+        container (ContainerProxy): the assemblies container holding the evaluation records
+        record (Dict[str, Any]): the evaluation record, keyed by its `task_id`
+    """
+    try:
+        await container.upsert_item(record)
+    except exceptions.CosmosHttpResponseError:
+        logger.exception("Could not save evaluation %s", record["task_id"])
+
+
+async def run_evaluation_task(
+    container: ContainerProxy, record: Dict[str, Any], assembly: Assembly, prompt: str
+) -> None:
+    """
+    run_evaluation_task Runs a background evaluation and records its outcome.
+
+    The record ends as `done` with the verdict, `failed` with the error, or `cancelled` if the
+    worker shuts down first. Evaluation errors are stored instead of raised.
+
+    Args:
+        container (ContainerProxy): the assemblies container holding the evaluation records
+        record (Dict[str, Any]): the `running` record written when the evaluation was accepted
+        assembly (Assembly): the Assembly judging the prompt
+        prompt (str): the prompt to evaluate
+    """
+    try:
+        verdict = await JudgeOrchestrator.run_evaluation(assembly, prompt)
+    except asyncio.CancelledError:
+        await save_evaluation_record(container, {**record, "status": "cancelled"})
+        raise
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        outcome = {"status": "failed", "detail": str(ex)}
+    else:
+        outcome = {"status": "done", "result": verdict}
+    await save_evaluation_record(container, {**record, **outcome})
+
+
+@app.post("/evaluate-async", tags=["Judge Execution"])
+async def evaluate_judgment_async(request: Request, evaluation: JudgeEvaluation) -> ORJSONResponse:
+    """
+    Endpoint that starts the evaluation of a prompt in the background.
+
+    Follows the same process as `/evaluate`, but answers `202 Accepted` with a `task_id` as
+    soon as the Assembly is found, instead of holding the connection for the slowest judge.
+    Poll `GET /evaluate/{task_id}` for the verdict. The state of the evaluation is stored in
+    Cosmos DB, so the poll may reach any worker. A worker already running
+    MAX_RUNNING_EVALUATIONS evaluations answers `429 Too Many Requests`.
+    """
+    tasks: "set[asyncio.Task]" = request.app.state.evaluation_tasks
+    if len(tasks) >= MAX_RUNNING_EVALUATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many evaluations in progress, retry later.",
+        )
+
+    container = request.app.state.assemblies_container
+    assembly_doc = await fetch_assembly(container, evaluation.id)
+    if not assembly_doc:
+        raise HTTPException(status_code=404, detail=f"Assembly '{evaluation.id}' not found.")
+
+    assembly = Assembly(**assembly_doc)
+
+    task_id = uuid4().hex
+    record = {
+        "id": task_id,
+        "task_id": task_id,
+        "assembly_id": evaluation.id,
+        "status": "running",
+        "ttl": EVALUATION_RECORD_TTL,
+    }
+    await container.upsert_item(record)
+
+    task = asyncio.create_task(run_evaluation_task(container, record, assembly, evaluation.prompt))
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+
+    response_body = SuccessMessage(
+        title="Evaluation Accepted",
+        message="Judging has started, poll the task for its verdict.",
+        content={"assembly_id": evaluation.id, "task_id": task_id},
+    )
+    return ORJSONResponse(status_code=status.HTTP_202_ACCEPTED, content=response_body)
+
+
+@app.get("/evaluate/{task_id}", tags=["Judge Execution"])
+async def get_evaluation(request: Request, task_id: str) -> ORJSONResponse:
+    """
+    Endpoint that reports the state of an evaluation started with `/evaluate-async`.
+
+    Answers `202 Accepted` while the judges are still running, and the final aggregated
+    verdict once they are done.
+    """
+    try:
+        record = await request.app.state.assemblies_container.read_item(
+            item=task_id, partition_key=task_id
+        )
+    except exceptions.CosmosResourceNotFoundError:
+        record = None
+    if record is None or record.get("task_id") != task_id:
+        raise HTTPException(status_code=404, detail=f"Evaluation '{task_id}' not found.")
+
+    content = {"assembly_id": record["assembly_id"], "task_id": task_id}
+    if record["status"] == "running":
+        response_body = SuccessMessage(
+            title="Evaluation Pending",
+            message="Judging is still in progress.",
+            content=content,
+        )
+        return ORJSONResponse(status_code=status.HTTP_202_ACCEPTED, content=response_body)
+
+    if record["status"] == "cancelled":
+        raise HTTPException(status_code=500, detail="Evaluation was cancelled.")
+    if record["status"] == "failed":
+        raise HTTPException(status_code=500, detail=record["detail"])
+
+    response_body = SuccessMessage(
+        title="Evaluation Complete",
+        message="Judging completed successfully.",
+        content={**content, "result": record["result"]},
+    )
+    return ORJSONResponse(status_code=status.HTTP_200_OK, content=response_body)
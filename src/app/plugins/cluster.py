@@ -1,5 +1,8 @@
 import importlib
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
 
 
 class DataSetAdapter(ABC):
@@ -14,6 +17,52 @@ class DataSetAdapter(ABC):
         pass
 
 
+@lru_cache(maxsize=None)
+def _get_algo(algorithm_name):
+    """
+    Resolve a clustering algorithm class from sklearn.cluster.
+    
+    The import and the lookup run once per algorithm name; failures are not cached.
+    
+    Raises:
+        ImportError: If the sklearn.cluster module cannot be imported.
+        ValueError: If the specified algorithm is not found in sklearn.cluster.
+    """
+    try:
+        clustering_module = importlib.import_module("sklearn.cluster")
+        return getattr(clustering_module, algorithm_name)
+    except ImportError as e:
+        raise ImportError(f"Could not import sklearn.cluster: {str(e)}")
+    except AttributeError:
+        raise ValueError(f"Clustering algorithm '{algorithm_name}' not found in sklearn.cluster.")
+
+
+def pairwise_sq_euclidean(X, C, X_norm_squared=None):
+    """
+    Compute the squared Euclidean distances between the rows of X and the rows of C.
+    
+    Uses ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, so the O(N*K*D) work is the single X @ C.T
+    product, dispatched to BLAS (sgemm for float32, dgemm for float64). The distance matrix is
+    then finished in place.
+    
+    Parameters:
+        X (np.ndarray): Samples, shape (n_samples, n_features).
+        C (np.ndarray): Centroids, shape (n_clusters, n_features).
+        X_norm_squared (np.ndarray): Optional precomputed squared norms of the rows of X.
+    
+    Returns:
+        np.ndarray: Distances of shape (n_samples, n_clusters), clipped at zero.
+    """
+    if X_norm_squared is None:
+        X_norm_squared = np.einsum("ij,ij->i", X, X)
+    distances = X @ C.T
+    distances *= -2
+    distances += X_norm_squared[:, np.newaxis]
+    distances += np.einsum("ij,ij->i", C, C)[np.newaxis, :]
+    np.maximum(distances, 0, out=distances)
+    return distances
+
+
 class ClusteringPlugin:
     """
     A semantic kernel plugin for training and inference with a clustering algorithm.
@@ -28,6 +77,12 @@ class ClusteringPlugin:
         model: The trained clustering model instance.
     """
     
+    # KMeans on more samples than this is trained with MiniBatchKMeans instead.
+    MINIBATCH_THRESHOLD = 100_000
+    MINIBATCH_SIZE = 4096
+    # KMeans parameters that MiniBatchKMeans does not accept; giving one keeps full-batch KMeans.
+    FULL_BATCH_PARAMS = frozenset({"algorithm", "copy_x"})
+    
     def __init__(self, algorithm_name: str, dataset_connection: DataSetAdapter, **kwargs):
         """
         Initialize the ClusteringPlugin.
@@ -46,21 +101,17 @@ class ClusteringPlugin:
         self.model_params = kwargs
         self.model = None
         
-        # Dynamically import the clustering algorithm from sklearn.cluster using importlib.
-        try:
-            clustering_module = importlib.import_module("sklearn.cluster")
-            self.algorithm_class = getattr(clustering_module, algorithm_name)
-        except ImportError as e:
-            raise ImportError(f"Could not import sklearn.cluster: {str(e)}")
-        except AttributeError:
-            raise ValueError(f"Clustering algorithm '{algorithm_name}' not found in sklearn.cluster.")
+        # Dynamically import the clustering algorithm from sklearn.cluster, once per name.
+        self.algorithm_class = _get_algo(algorithm_name)
     
     def train(self):
         """
         Train the clustering model using data loaded from the dataset adapter.
         
         The method loads data, instantiates the clustering algorithm with the provided parameters,
-        and fits the model to the data.
+        and fits the model to the data. KMeans on more than MINIBATCH_THRESHOLD samples is fitted
+        with sklearn's MiniBatchKMeans instead (batch_size defaults to MINIBATCH_SIZE), which
+        touches a fraction of the data per iteration with comparable cluster quality.
         
         Returns:
             model: The trained clustering model.
@@ -69,12 +120,26 @@ class ClusteringPlugin:
         data = self.dataset_connection.load_data()
         
         # Instantiate the clustering model with the provided parameters.
-        self.model = self.algorithm_class(**self.model_params)
+        if self._use_minibatch_kmeans(data):
+            params = {"batch_size": self.MINIBATCH_SIZE, **self.model_params}
+            self.model = _get_algo("MiniBatchKMeans")(**params)
+        else:
+            self.model = self.algorithm_class(**self.model_params)
         
         # Fit the model to the loaded data.
         self.model.fit(data)
         return self.model
     
+    def _use_minibatch_kmeans(self, data):
+        """
+        Whether KMeans should be swapped for MiniBatchKMeans on this dataset.
+        """
+        return (
+            self.algorithm_name == "KMeans"
+            and len(data) > self.MINIBATCH_THRESHOLD
+            and not self.FULL_BATCH_PARAMS & self.model_params.keys()
+        )
+    
     def infer(self, new_data):
         """
         Perform inference using the trained clustering model on new data.
@@ -100,18 +165,55 @@ class ClusteringPlugin:
 
 
 class CSVDataSetAdapter(DataSetAdapter):
-    def __init__(self, file_path, delimiter=","):
+    def __init__(self, file_path, delimiter=",", dtype=np.float32):
         self.file_path = file_path
         self.delimiter = delimiter
+        self.dtype = dtype
     
     def load_data(self):
         """
-        Load data from a CSV file into a numpy array.
+        Load data from a CSV file into a C-contiguous numpy array of `dtype`.
+        
+        The file is parsed with pyarrow's multithreaded CSV reader when it is installed, and
+        each column is copied once, straight into the output array. Otherwise pandas is used.
+        Columns without any value are kept as NaN on both paths.
+        
+        Returns:
+            np.ndarray: The numeric columns of the CSV file.
+        """
+        # Assuming the features are all numeric columns; modify if needed.
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
+        except ImportError:
+            import pandas as pd
+            df = pd.read_csv(self.file_path, delimiter=self.delimiter).select_dtypes('number')
+            return np.ascontiguousarray(df.to_numpy(dtype=self.dtype, copy=False))
+        
+        table = pacsv.read_csv(
+            self.file_path, parse_options=pacsv.ParseOptions(delimiter=self.delimiter)
+        )
+        columns = [
+            column for column in table.columns
+            if pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+            or pa.types.is_null(column.type)
+        ]
+        data = np.empty((table.num_rows, len(columns)), dtype=self.dtype)
+        for i, column in enumerate(columns):
+            # pandas reads an all-empty column as float NaN, while pyarrow types it as null
+            data[:, i] = np.nan if pa.types.is_null(column.type) else column.to_numpy()
+        return data
+    
+    def load_lazy(self):
+        """
+        Scan the CSV file lazily with polars.
+        
+        Nothing is read until the query is collected, so downstream consumers (e.g.
+        StatisticalAnalysisPlugin.compute_category_statistics) push their projections,
+        filters and aggregations into the scan.
         
         Returns:
-            np.ndarray: The data loaded from the CSV file.
+            polars.LazyFrame: The lazy scan of the CSV file.
         """
-        import pandas as pd
-        df = pd.read_csv(self.file_path, delimiter=self.delimiter)
-        # Assuming the features are all columns; modify if needed.
-        return df.values
+        import polars as pl
+        return pl.scan_csv(self.file_path, separator=self.delimiter)
@@ -1,9 +1,26 @@
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 
 import pandas as pd
 from kaggle.api.kaggle_api_extended import KaggleApi
 
+# Marks a dataset as fully downloaded into a directory, so later reads skip the download.
+SENTINEL_PREFIX = ".kaggle_done_"
+
+
+@lru_cache(maxsize=1)
+def _kaggle_api() -> KaggleApi:
+    """
+    Returns the process-wide authenticated Kaggle API client.
+    
+    Authentication reads the credentials and sets up the HTTP session once; readers share
+    the client until the credentials change.
+    """
+    api = KaggleApi()
+    api.authenticate()
+    return api
+
 
 class KaggleDatasetReader:
     """
@@ -37,22 +54,28 @@ class KaggleDatasetReader:
             
         If the credentials are not provided, ensure that your Kaggle configuration file
         (~/.kaggle/kaggle.json) is correctly set up.
+        
+        The authenticated API client is shared by all readers; passing different credentials
+        authenticates a new one.
         """
         if kaggle_username and kaggle_key:
-            os.environ['KAGGLE_USERNAME'] = kaggle_username
-            os.environ['KAGGLE_KEY'] = kaggle_key
+            credentials = (os.environ.get('KAGGLE_USERNAME'), os.environ.get('KAGGLE_KEY'))
+            if credentials != (kaggle_username, kaggle_key):
+                os.environ['KAGGLE_USERNAME'] = kaggle_username
+                os.environ['KAGGLE_KEY'] = kaggle_key
+                _kaggle_api.cache_clear()
         
-        self.api = KaggleApi()
-        self.api.authenticate()
+        self.api = _kaggle_api()
         
-    def read_dataset(self, dataset: str, file_name: Optional[str] = None, download_path: str = "./kaggle_data", unzip: bool = True):
+    def read_dataset(self, dataset: str, file_name: Optional[str] = None, download_path: str = "./kaggle_data", unzip: bool = True, force_download: bool = False, lazy: bool = False):
         """
         Downloads and reads a Kaggle dataset.
         
         This semantic kernel plugin function performs the following:
-          1. Downloads the dataset files into a local directory.
+          1. Downloads the dataset files into a local directory, unless a previous call already
+             did (tracked by a `.kaggle_done_<slug>` sentinel file in that directory).
           2. If a specific file is provided:
-              - Returns a pandas DataFrame if the file is a CSV.
+              - Returns a pandas DataFrame if the file is a CSV (a polars LazyFrame if `lazy`).
               - Otherwise, returns the file contents as a string.
           3. If no file is provided, returns a list of file names in the downloaded dataset.
         
@@ -61,36 +84,72 @@ class KaggleDatasetReader:
             file_name (str): (Optional) The specific file name to read.
             download_path (str): The local directory where the dataset is downloaded.
             unzip (bool): Whether to unzip the downloaded files.
+            force_download (bool): Download the dataset again even if it is already present.
+            lazy (bool): Return CSV files as a lazy polars scan instead of reading them.
             
         Returns:
             list or pandas.DataFrame or str:
                 - List of file names if `file_name` is None.
-                - pandas.DataFrame if `file_name` ends with '.csv'.
+                - pandas.DataFrame if `file_name` ends with '.csv' (polars.LazyFrame if `lazy`).
                 - str for other file types.
                 
         Raises:
             FileNotFoundError: If the specified file is not found in the downloaded dataset.
         """
         # Ensure the download path exists
-        if not os.path.exists(download_path):
-            os.makedirs(download_path)
+        os.makedirs(download_path, exist_ok=True)
         
-        # Download dataset files from Kaggle (this will overwrite existing files)
-        self.api.dataset_download_files(dataset, path=download_path, unzip=unzip)
+        # Download dataset files from Kaggle (this will overwrite existing files), once per slug
+        sentinel = SENTINEL_PREFIX + dataset.replace("/", "__")
+        names = self._list_dir(download_path)
+        if force_download or sentinel not in names:
+            self.api.dataset_download_files(dataset, path=download_path, unzip=unzip)
+            with open(os.path.join(download_path, sentinel), 'w', encoding='utf-8'):
+                pass
+            names = self._list_dir(download_path)
         
         # List downloaded files
-        files = os.listdir(download_path)
+        files = [name for name in names if not name.startswith(SENTINEL_PREFIX)]
         
         if file_name:
             file_path = os.path.join(download_path, file_name)
-            if not os.path.exists(file_path):
+            # Top-level files are found in the listing; only nested paths need a stat.
+            if file_name not in names and not os.path.exists(file_path):
                 raise FileNotFoundError(f"File '{file_name}' not found in dataset '{dataset}'.")
             
             # Return a DataFrame if CSV; else, return file contents as text
             if file_path.lower().endswith('.csv'):
-                return pd.read_csv(file_path)
+                if lazy:
+                    import polars as pl
+                    return pl.scan_csv(file_path)
+                return self._read_csv(file_path)
             else:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     return f.read()
         
         return files
+
+    @staticmethod
+    def _list_dir(path: str) -> Dict[str, None]:
+        """
+        Lists the entries of a directory with a single scandir call.
+        
+        The names are returned as the keys of a dict, which keeps the directory order and
+        allows constant-time lookups.
+        """
+        with os.scandir(path) as entries:
+            return {entry.name: None for entry in entries}
+
+    @staticmethod
+    def _read_csv(file_path: str) -> pd.DataFrame:
+        """
+        Reads a CSV file into a pandas DataFrame.
+        
+        pyarrow's multithreaded parser is used when installed, releasing its buffers while
+        the DataFrame is built; otherwise pandas reads the file.
+        """
+        try:
+            from pyarrow import csv as pacsv
+        except ImportError:
+            return pd.read_csv(file_path)
+        return pacsv.read_csv(file_path).to_pandas(split_blocks=True, self_destruct=True)
@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from scipy import stats
@@ -31,30 +34,144 @@ class StatisticalAnalysisPlugin:
             dict: A dictionary containing:
                   - mode, median, mean, std, variance, coefficient_of_variation,
                   - kurtosis, skewness, and the specified percentiles.
+                  Missing (NaN) values are ignored by every statistic.
         """
         data = np.asarray(data)
+        # Strip NaNs once, so none of the statistics below needs its own NaN handling.
+        if data.dtype.kind == 'f':
+            data = data[~np.isnan(data)]
         stats_dict = {}
 
-        mode_result = stats.mode(data, nan_policy='omit')
-        mode_val = mode_result.mode[0] if mode_result.count[0] > 0 else np.nan
-        stats_dict['mode'] = mode_val
+        stats_dict['mode'] = self._mode(data)
+
+        # The median and every percentile come from a single partition of the data.
+        *pct_values, stats_dict['median'] = self._percentiles(data, [*percentiles, 50])
 
-        stats_dict['median'] = np.median(data)
-        stats_dict['mean'] = np.mean(data)
-        stats_dict['std'] = np.std(data, ddof=1)
-        stats_dict['variance'] = np.var(data, ddof=1)
+        # Mean, variance, skewness and kurtosis all come from one set of central moments.
+        mean, variance, skewness, kurtosis = self._moments(data)
+        stats_dict['mean'] = mean
+        stats_dict['std'] = np.sqrt(variance)
+        stats_dict['variance'] = variance
         stats_dict['coefficient_of_variation'] = (stats_dict['std'] / stats_dict['mean']
                                                   if stats_dict['mean'] != 0 else np.nan)
         
-        stats_dict['kurtosis'] = stats.kurtosis(data, fisher=True, bias=False, nan_policy='omit')
-        stats_dict['skewness'] = stats.skew(data, bias=False, nan_policy='omit')
+        stats_dict['kurtosis'] = kurtosis
+        stats_dict['skewness'] = skewness
 
-        pct_values = np.percentile(data, percentiles)
         for perc, value in zip(percentiles, pct_values):
             stats_dict[f'percentile_{perc}'] = value
         
         return stats_dict
 
+    @staticmethod
+    def _mode(data):
+        """
+        Find the most frequent value, the smallest one on ties (as scipy.stats.mode does).
+
+        Small non-negative integers are counted with np.bincount; any other data goes
+        through pandas' hash-based value counts.
+
+        Parameters:
+            data (np.ndarray): 1D numeric data without NaNs.
+
+        Returns:
+            The mode, or NaN if the data is empty.
+        """
+        if data.size == 0:
+            return np.nan
+        # bincount allocates one counter per value up to the maximum, so bound its range.
+        if data.dtype.kind in 'iu' and data.min() >= 0 and data.max() <= 4 * data.size:
+            return data.dtype.type(np.bincount(data).argmax())
+        return pd.Series(data).mode().iloc[0]
+
+    @staticmethod
+    def _percentiles(data, percentiles):
+        """
+        Compute percentiles with numpy's default linear interpolation.
+
+        Instead of sorting, one np.partition places the two order statistics around every
+        requested rank, which is O(n) for a short list of percentiles.
+
+        Parameters:
+            data (np.ndarray): 1D numeric data without NaNs.
+            percentiles (list): Percentiles to compute, between 0 and 100.
+
+        Returns:
+            np.ndarray: The percentile values, NaN if the data is empty.
+
+        Raises:
+            ValueError: If a percentile is outside [0, 100], as np.percentile does.
+        """
+        percentiles = np.asarray(percentiles, dtype=np.float64)
+        if not np.all((percentiles >= 0) & (percentiles <= 100)):
+            raise ValueError("Percentiles must be in the range [0, 100]")
+
+        n = data.size
+        if n == 0:
+            return np.full(len(percentiles), np.nan)
+
+        positions = percentiles / 100 * (n - 1)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.minimum(lower + 1, n - 1)
+        part = np.partition(data, np.unique(np.concatenate([lower, upper])))
+        low, high = part[lower].astype(np.float64), part[upper].astype(np.float64)
+        return low + (high - low) * (positions - lower)
+
+    @staticmethod
+    def _moments(data):
+        """
+        Compute the mean, sample variance, and bias-corrected skewness and excess kurtosis.
+
+        The data is centered once; the 2nd, 3rd and 4th central moments are then BLAS dot
+        products over that single buffer, instead of one full pass per statistic.
+
+        Parameters:
+            data (np.ndarray): 1D numeric data.
+
+        Returns:
+            tuple: (mean, variance, skewness, kurtosis), matching np.var(ddof=1),
+                   stats.skew(bias=False) and stats.kurtosis(fisher=True, bias=False).
+        """
+        n = data.size
+        if n == 0:
+            return np.nan, np.nan, np.nan, np.nan
+
+        mean = data.mean()
+        d = np.asarray(data - mean, dtype=np.float64)
+        d2 = d * d
+        m2 = d2.sum()
+        m3 = np.dot(d2, d)
+        m4 = np.dot(d2, d2)
+
+        variance = m2 / (n - 1) if n > 1 else np.nan
+        skewness, kurtosis = StatisticalAnalysisPlugin._shape_statistics(n, m2, m3, m4)
+        return mean, variance, skewness[()], kurtosis[()]
+
+    @staticmethod
+    def _shape_statistics(n, m2, m3, m4):
+        """
+        Compute bias-corrected skewness and excess kurtosis from central moment sums.
+
+        Works elementwise, so the same formulas serve a single sample or every group at once.
+
+        Parameters:
+            n (array-like): Number of observations.
+            m2, m3, m4 (array-like): Sums of the 2nd, 3rd and 4th powers of the deviations.
+
+        Returns:
+            tuple: (skewness, kurtosis) arrays, NaN where the variance is zero.
+        """
+        n = np.asarray(n, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            g1 = (m3 / n) / (m2 / n) ** 1.5
+            g2 = (m4 / n) / (m2 / n) ** 2 - 3.0
+            # Like scipy, samples too small to correct keep the biased estimate
+            skewness = np.where(n > 2, g1 * np.sqrt(n * (n - 1)) / (n - 2), g1)
+            kurtosis = np.where(n > 3, ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3)), g2)
+        skewness = np.where(m2 > 0, skewness, np.nan)
+        kurtosis = np.where(m2 > 0, kurtosis, np.nan)
+        return skewness, kurtosis
+
     def kolmogorov_smirnov_test(self, data, cdf='norm'):
         """
         Perform the Kolmogorov-Smirnov test for goodness-of-fit.
@@ -121,15 +238,13 @@ class StatisticalAnalysisPlugin:
         var2 = np.var(sample2, ddof=1)
         
         # Force the ratio to be >= 1 for a two-tailed test.
-        if var1 >= var2:
-            f_stat = var1 / var2
-            df1, df2 = n1 - 1, n2 - 1
-        else:
-            f_stat = var2 / var1
-            df1, df2 = n2 - 1, n1 - 1
+        if var1 < var2:
+            var1, var2, n1, n2 = var2, var1, n2, n1
+        f_stat = var1 / var2
         
-        # Two-tailed p-value.
-        p_value = 2 * min(stats.f.cdf(f_stat, df1, df2), 1 - stats.f.cdf(f_stat, df1, df2))
+        # Two-tailed p-value from a single survival function evaluation.
+        sf = stats.f.sf(f_stat, n1 - 1, n2 - 1)
+        p_value = 2 * min(1 - sf, sf)
         return f_stat, p_value
 
     def chi_square_test(self, observed, expected):
@@ -148,7 +263,7 @@ class StatisticalAnalysisPlugin:
         result = stats.chisquare(observed, f_exp=expected)
         return result.statistic, result.pvalue
 
-    def compute_category_statistics(self, df, category_column, value_columns=None, percentiles=[5, 25, 50, 75, 95]):
+    def compute_category_statistics(self, df, category_column, value_columns=None, percentiles=[5, 25, 50, 75, 95], max_workers=None):
         """
         Compute a matrix of descriptive statistics for each category in a dataset.
 
@@ -160,38 +275,155 @@ class StatisticalAnalysisPlugin:
         The result is returned as a multi-index DataFrame where rows represent categories and
         columns are a MultiIndex (value column, statistic).
 
+        A polars DataFrame or LazyFrame (e.g. from CSVDataSetAdapter.load_lazy) is aggregated by
+        polars in a single lazy query instead; the result has the same layout.
+
         Parameters:
-            df (pandas.DataFrame): The dataset.
+            df (pandas.DataFrame or polars.DataFrame or polars.LazyFrame): The dataset.
             category_column (str): Column name used to group the data.
             value_columns (list): List of numeric column names to analyze. If None, all numeric columns
                                   except the category column are used.
             percentiles (list): List of percentiles to compute.
+            max_workers (int): Threads used for the per-column modes of the pandas path.
+                               Defaults to the number of CPUs.
 
         Returns:
             pandas.DataFrame: A matrix of computed statistics with a MultiIndex for columns.
         """
+        if type(df).__module__.startswith('polars'):
+            return self._compute_category_statistics_polars(
+                df, category_column, value_columns, percentiles
+            )
+        
         if value_columns is None:
             value_columns = df.select_dtypes(include=[np.number]).columns.tolist()
             if category_column in value_columns:
                 value_columns.remove(category_column)
         
-        def series_stats(series):
-            return self.calculate_statistics(series.dropna(), percentiles=percentiles)
+        # Every statistic is a vectorized groupby reduction over all categories at once;
+        # missing values are skipped, as the per-series dropna did.
+        keys = df[category_column]
+        grouped = df.groupby(category_column)[value_columns]
+        count = grouped.count()
+        mean = grouped.mean()
+        
+        deviations = df[value_columns] - grouped.transform('mean')
+        squared = deviations ** 2
+        m2 = squared.groupby(keys).sum()
+        m3 = (squared * deviations).groupby(keys).sum()
+        m4 = (squared ** 2).groupby(keys).sum()
+        skewness, kurtosis = self._shape_statistics(
+            count.to_numpy(), m2.to_numpy(), m3.to_numpy(), m4.to_numpy()
+        )
         
-        grouped = df.groupby(category_column)
+        variance = (m2 / (count - 1)).where(count > 1)
+        std = np.sqrt(variance)
         
-        result_dict = {}
-        for cat, group in grouped:
-            col_stats = {}
-            for col in value_columns:
-                col_stats[col] = series_stats(group[col])
-            result_dict[cat] = col_stats
-
-        final_data = {}
-        for cat, stats_per_col in result_dict.items():
-            df_stats = pd.DataFrame(stats_per_col).T
-            final_data[cat] = df_stats.T.stack()
+        statistics = {
+            'mode': self._category_modes(
+                df, category_column, value_columns, mean.index, max_workers
+            ),
+            'median': grouped.median(),
+            'mean': mean,
+            'std': std,
+            'variance': variance,
+            'coefficient_of_variation': (std / mean).where(mean != 0),
+            'kurtosis': kurtosis,
+            'skewness': skewness,
+        }
+        for perc in percentiles:
+            statistics[f'percentile_{perc}'] = grouped.quantile(perc / 100)
         
-        combined_df = pd.DataFrame(final_data).T
-        combined_df.columns = pd.MultiIndex.from_tuples(combined_df.columns)
-        return combined_df
+        # Fill one (categories x value columns * statistics) block; statistic k of column j
+        # lands at j * n_stats + k, the layout of MultiIndex.from_product.
+        n_stats = len(statistics)
+        columns = pd.MultiIndex.from_product([value_columns, list(statistics)])
+        out = np.empty((len(mean.index), len(columns)))
+        for k, values in enumerate(statistics.values()):
+            out[:, k::n_stats] = values
+        return pd.DataFrame(out, index=mean.index, columns=columns)
+
+    @staticmethod
+    def _compute_category_statistics_polars(df, category_column, value_columns, percentiles):
+        """
+        Polars implementation of compute_category_statistics.
+
+        Every statistic of every value column is an expression of one lazy group_by, so the
+        whole matrix is computed by a single query in the polars engine. NaN and null values
+        are ignored, and rows without a category are dropped, as in the pandas path.
+        """
+        import polars as pl
+
+        lf = df.lazy()
+        if value_columns is None:
+            value_columns = [
+                name for name, dtype in lf.collect_schema().items()
+                if dtype.is_numeric() and name != category_column
+            ]
+
+        stat_names = ['mode', 'median', 'mean', 'std', 'variance', 'coefficient_of_variation',
+                      'kurtosis', 'skewness'] + [f'percentile_{perc}' for perc in percentiles]
+        aggregations = []
+        for j, col in enumerate(value_columns):
+            values = pl.col(col).cast(pl.Float64).fill_nan(None)
+            mean, std, count = values.mean(), values.std(), values.count()
+            expressions = [
+                values.drop_nulls().mode().min(),
+                values.median(),
+                mean,
+                std,
+                values.var(),
+                pl.when(mean != 0).then(std / mean),
+                # Like scipy, samples too small to correct keep the biased estimate
+                pl.when(count > 3).then(values.kurtosis(bias=False)).otherwise(values.kurtosis()),
+                pl.when(count > 2).then(values.skew(bias=False)).otherwise(values.skew()),
+            ] + [values.quantile(perc / 100, interpolation='linear') for perc in percentiles]
+            # Aggregations are emitted in MultiIndex.from_product order: column, then statistic.
+            aggregations += [expr.alias(f'{j}/{k}') for k, expr in enumerate(expressions)]
+
+        result = (
+            lf.filter(pl.col(category_column).is_not_null())
+            .group_by(category_column)
+            .agg(aggregations)
+            .sort(category_column)
+            .collect()
+        )
+        index = pd.Index(result.get_column(category_column).to_list(), name=category_column)
+        columns = pd.MultiIndex.from_product([value_columns, stat_names])
+        out = result.drop(category_column).to_numpy().astype(np.float64, copy=False)
+        return pd.DataFrame(out, index=index, columns=columns)
+
+    @staticmethod
+    def _category_modes(df, category_column, value_columns, categories, max_workers=None):
+        """
+        Find the most frequent value of each column within each category.
+
+        Ties resolve to the smallest value, as scipy.stats.mode does. Categories without any
+        value in a column get NaN. Columns are independent, so they are counted on a thread
+        pool: the hashing and sorting run in pandas and numpy code that releases the GIL.
+        """
+        def column_mode(col):
+            counts = df.groupby([category_column, col]).size()
+            if counts.empty:
+                # The column has no values at all (e.g. all NaN, or an empty frame)
+                return np.full(len(categories), np.nan)
+            category_codes = counts.index.codes[0]
+            values = counts.index.levels[1].to_numpy()[counts.index.codes[1]]
+            # Within each category: highest count first, then smallest value
+            order = np.lexsort((values, -counts.to_numpy(), category_codes))
+            ordered_codes = category_codes[order]
+            first = order[np.r_[True, ordered_codes[1:] != ordered_codes[:-1]]]
+            mode = pd.Series(values[first], index=counts.index.levels[0][category_codes[first]])
+            return mode.reindex(categories).to_numpy()
+
+        workers = min(len(value_columns), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                columns = list(executor.map(column_mode, value_columns))
+        else:
+            columns = [column_mode(col) for col in value_columns]
+
+        modes = np.full((len(categories), len(value_columns)), np.nan)
+        for j, column in enumerate(columns):
+            modes[:, j] = column
+        return modes
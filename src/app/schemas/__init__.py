@@ -13,11 +13,28 @@ __all__ = [
 ]
 __author__ = "AI GBBS"
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from .endpoints import JudgeEvaluation
 from .models import Assembly, Judge
 from .responses import RESPONSES, ErrorMessage, SuccessMessage
 
-database_schema = {
-    "Judge Table": Judge.model_json_schema(),
-    "Assembly Table": Assembly.model_json_schema(),
-}
+
+@lru_cache(maxsize=None)
+def _schema(model: type) -> Mapping[str, Any]:
+    """JSON schema of a model, generated once per process."""
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def _database_schema() -> Mapping[str, Mapping[str, Any]]:
+    return MappingProxyType({"Judge Table": _schema(Judge), "Assembly Table": _schema(Assembly)})
+
+
+def __getattr__(name: str) -> Any:
+    # database_schema is built on first access rather than at import time
+    if name == "database_schema":
+        return _database_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
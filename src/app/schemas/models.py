@@ -6,10 +6,10 @@ Classes:
     Assemble: Represents an Assemble with an id, list of judges, and roles.
 """
 
-import json
-from typing import List
+from typing import Annotated, List
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 
 class Judge(BaseModel):
@@ -18,30 +18,39 @@ class Judge(BaseModel):
 
     Attributes:
         id (str): The unique identifier for the judge.
-        model (HttpUrl): The model name of the judge.
+        model (str): The https URL of the judge's model.
         metaprompt (str): The metaprompt for the judge.
+        system_text (str): The "text" entry of the metaprompt, parsed once at validation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Judge ID")
     name: str = Field(..., description="Judge Name", max_length=16)
-    model: HttpUrl = Field(..., description="Model URL")
+    model: Annotated[str, Field(pattern=r"^https://")] = Field(..., description="Model URL")
     metaprompt: str = Field(..., description="Judge System Prompt", max_length=60)
+    _system_text: str = PrivateAttr(default="System Prompt Missing")
 
-    @field_validator("model")
+    @field_validator("model", mode="before")
     def model_must_be_azure_url(cls, v):
-        if not v.startswith("https://"):
+        if not (isinstance(v, str) and v.startswith("https://")):
             raise ValueError("model must be a URL from Azure Open AI")
         return v
 
-    @field_validator("metaprompt")
-    def metaprompt_must_be_json_serializable(cls, v):
+    @model_validator(mode="after")
+    def metaprompt_must_be_json_serializable(self):
         try:
-            json.loads(v)
-        except json.JSONDecodeError:
+            meta = orjson.loads(self.metaprompt)
+        except orjson.JSONDecodeError:
             raise ValueError("metaprompt must be JSON serializable")
-        if not ("text" in v and "json" in v):
+        if not (isinstance(meta, dict) and "text" in meta and "json" in meta):
             raise ValueError("metaprompt must contain the format (text, json)")
-        return v
+        self._system_text = meta["text"]
+        return self
+
+    @property
+    def system_text(self) -> str:
+        return self._system_text
 
 
 class Assembly(BaseModel):
@@ -54,6 +63,8 @@ class Assembly(BaseModel):
         roles (List[str]): A list of roles.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Judge Assembly ID")
     judges: List[Judge] = Field(..., description="Judges Assemblies")
     roles: List[str] = Field(..., description="Judge Roles ID")
@@ -0,0 +1,66 @@
+import builtins
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics.pairwise import euclidean_distances
+
+from app.plugins.cluster import (
+    ClusteringPlugin,
+    CSVDataSetAdapter,
+    DataSetAdapter,
+    pairwise_sq_euclidean,
+)
+
+
+def blobs(n=600, dtype=np.float32):
+    rng = np.random.default_rng(0)
+    centers = np.array([[0.0, 0.0], [6.0, 0.0], [0.0, 6.0]])
+    return (centers[np.arange(n) % 3] + rng.normal(size=(n, 2))).astype(dtype)
+
+
+def test_train_dispatches_kmeans():
+    dataset = MagicMock(spec=DataSetAdapter)
+    dataset.load_data.return_value = blobs()
+    plugin = ClusteringPlugin("KMeans", dataset, n_clusters=3, random_state=0)
+
+    # Assertions: sklearn KMeans for small datasets, MiniBatchKMeans above the threshold
+    assert type(plugin.train()) is KMeans
+    with patch.object(ClusteringPlugin, "MINIBATCH_THRESHOLD", 100):
+        assert isinstance(plugin.train(), MiniBatchKMeans)
+
+
+def test_pairwise_sq_euclidean_matches_sklearn():
+    X = blobs(dtype=np.float64)
+    C = X[[0, 1, 2]]
+
+    # Assertions
+    expected = euclidean_distances(X, C, squared=True)
+    np.testing.assert_allclose(pairwise_sq_euclidean(X, C), expected, atol=1e-9)
+
+
+def test_csv_adapter_readers_agree(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.csv"
+    path.write_text("a,empty,label,b\n1.5,,x,1\n2.5,,y,\n3.5,,z,3\n")
+    adapter = CSVDataSetAdapter(str(path))
+
+    real_import = builtins.__import__
+
+    def import_without_pyarrow(name, globals=None, *args, **kwargs):
+        # Only the adapter loses pyarrow; pandas may still use it internally
+        if name.startswith("pyarrow") and (globals or {}).get("__name__") == "app.plugins.cluster":
+            raise ImportError(name)
+        return real_import(name, globals, *args, **kwargs)
+
+    arrow_data = adapter.load_data()
+    with patch("builtins.__import__", side_effect=import_without_pyarrow):
+        pandas_data = adapter.load_data()
+
+    # Assertions: both paths keep the numeric and all-empty columns, with NaN for missing values
+    expected = np.array(
+        [[1.5, np.nan, 1.0], [2.5, np.nan, np.nan], [3.5, np.nan, 3.0]], dtype=np.float32
+    )
+    np.testing.assert_array_equal(arrow_data, expected)
+    np.testing.assert_array_equal(pandas_data, expected)
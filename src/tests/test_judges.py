@@ -1,34 +1,64 @@
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import semantic_kernel as sk
+from azure.cosmos import exceptions
+from pydantic import ValidationError
 
 from app.judges import (
+    NO_EVALUATIONS,
+    NO_OUTPUT,
     ConcreteJudge,
     JudgeBase,
     JudgeFactory,
     JudgeOrchestrator,
     Mediator,
+    SemanticVerdictCache,
     SuperJudge,
+    assembly_version,
     fetch_assembly,
 )
 from app.schemas import Assembly, Judge
 
+METAPROMPT = '{"text": "Test Prompt", "json": {}}'
+
+
+@pytest.fixture(autouse=True)
+def clear_verdict_cache():
+    JudgeOrchestrator.verdict_cache.clear()
+
+
+def test_judge_parses_system_text():
+    judge = Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt=METAPROMPT)
+
+    # Assertions: the metaprompt must hold both keys, not just mention them
+    assert judge.system_text == "Test Prompt"
+    with pytest.raises(ValidationError):
+        Judge(
+            id="2", name="Judge2", model="https://example.com/model1", metaprompt='{"json": "text"}'
+        )
+    with pytest.raises(ValidationError):
+        Judge(id="3", name="Judge3", model="https://example.com/model1", metaprompt="not json")
+
 
 @pytest.mark.asyncio
 async def test_concrete_judge_evaluate():
     # Mock Judge and Kernel
-    judge_data = Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt='{"text": "Test Prompt"}')
+    judge_data = Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt=METAPROMPT)
     kernel = MagicMock(spec=sk.Kernel)
     kernel.get_prompt_execution_settings_from_service_id.return_value = MagicMock()
 
-    # Create ConcreteJudge instance
-    judge = ConcreteJudge(judge_data=judge_data, kernel=kernel)
-
     # Mock ChatCompletionAgent and its behavior
-    agent_mock = AsyncMock()
-    agent_mock.invoke.return_value = [MagicMock(content="Test Result")]
-    ChatCompletionAgent = MagicMock(return_value=agent_mock)
+    async def invoke(chat_history):
+        yield MagicMock(content="Test Result", items=[])
+
+    agent_mock = MagicMock()
+    agent_mock.invoke = invoke
+
+    # Create ConcreteJudge instance
+    with patch("app.judges.ChatCompletionAgent", return_value=agent_mock):
+        judge = ConcreteJudge(judge_data=judge_data, kernel=kernel)
 
     # Set mediator to capture notifications
     mediator_mock = MagicMock(spec=Mediator)
@@ -45,6 +75,30 @@ async def test_concrete_judge_evaluate():
     )
 
 
+@pytest.mark.asyncio
+async def test_concrete_judge_reuses_agent():
+    # Mock Judge and Kernel
+    judge_data = Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt=METAPROMPT)
+    kernel = MagicMock(spec=sk.Kernel)
+    kernel.get_prompt_execution_settings_from_service_id.return_value = MagicMock()
+
+    async def invoke(chat_history):
+        yield MagicMock(content="Test Result", items=[])
+
+    agent_mock = MagicMock()
+    agent_mock.invoke = invoke
+
+    # Create ConcreteJudge instance and evaluate twice
+    with patch("app.judges.ChatCompletionAgent", return_value=agent_mock) as agent_cls:
+        judge = ConcreteJudge(judge_data=judge_data, kernel=kernel)
+        await judge.evaluate("First Prompt")
+        await judge.evaluate("Second Prompt")
+
+    # Assertions
+    agent_cls.assert_called_once()
+    kernel.get_prompt_execution_settings_from_service_id.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_super_judge_evaluate():
     # Mock Kernel
@@ -65,41 +119,331 @@ async def test_super_judge_evaluate():
     sub_judge_mock.evaluate.assert_called_once_with("Test Prompt")
 
 
+@pytest.mark.asyncio
+async def test_super_judge_bounds_inflight_judges():
+    # Sub-judges that record how many of them run at the same time
+    inflight, peak = 0, 0
+
+    class SlowJudge(JudgeBase):
+        async def evaluate(self, prompt):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0.01)
+            inflight -= 1
+
+    super_judge = SuperJudge(kernel=MagicMock(spec=sk.Kernel), max_inflight=2)
+    for _ in range(6):
+        super_judge.register_judge(SlowJudge())
+
+    # Run evaluate
+    await super_judge.evaluate("Test Prompt")
+
+    # Assertions
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_super_judges_share_inflight_limit():
+    # Sub-judges that record how many of them run at the same time
+    inflight, peak = 0, 0
+
+    class SlowJudge(JudgeBase):
+        async def evaluate(self, prompt):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0.01)
+            inflight -= 1
+
+    super_judges = [SuperJudge(kernel=MagicMock(spec=sk.Kernel)) for _ in range(3)]
+    for super_judge in super_judges:
+        for _ in range(3):
+            super_judge.register_judge(SlowJudge())
+
+    # Run concurrent evaluations, as concurrent requests would
+    with patch("app.judges.MAX_INFLIGHT_JUDGES", 2), patch.object(SuperJudge, "_shared_sem", None):
+        await asyncio.gather(*(super_judge.evaluate("Test Prompt") for super_judge in super_judges))
+
+    # Assertions
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_nested_super_judges_do_not_deadlock():
+    # Sub-judges that record how many of them run at the same time
+    inflight, peak = 0, 0
+
+    class SlowJudge(JudgeBase):
+        async def evaluate(self, prompt):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0.01)
+            inflight -= 1
+
+    # More nested SuperJudges than slots, each waiting on leaf judges
+    outer = SuperJudge(kernel=MagicMock(spec=sk.Kernel))
+    for _ in range(3):
+        inner = SuperJudge(kernel=MagicMock(spec=sk.Kernel))
+        for _ in range(2):
+            inner.register_judge(SlowJudge())
+        outer.register_judge(inner)
+
+    with patch("app.judges.MAX_INFLIGHT_JUDGES", 2), patch.object(SuperJudge, "_shared_sem", None):
+        await asyncio.wait_for(outer.evaluate("Test Prompt"), timeout=1)
+
+    # Assertions: only the leaf judges count against the limit
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_super_judge_cancels_on_failure():
+    super_judge = SuperJudge(kernel=MagicMock(spec=sk.Kernel))
+
+    # One failing sub-judge and one that would never finish on its own
+    failing = AsyncMock(spec=JudgeBase)
+    failing.evaluate.side_effect = ValueError("model unavailable")
+    hanging = AsyncMock(spec=JudgeBase)
+
+    async def hang(prompt):
+        await asyncio.sleep(3600)
+
+    hanging.evaluate.side_effect = hang
+    super_judge.register_judge(failing)
+    super_judge.register_judge(hanging)
+
+    # Assertions: the original error is raised and the other sub-judge is cancelled
+    with pytest.raises(ValueError, match="model unavailable"):
+        await asyncio.wait_for(super_judge.evaluate("Test Prompt"), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_super_judge_logs_concurrent_failures(caplog):
+    super_judge = SuperJudge(kernel=MagicMock(spec=sk.Kernel))
+
+    # Two sub-judges failing in the same round
+    for message in ("model unavailable", "quota exceeded"):
+        failing = AsyncMock(spec=JudgeBase)
+        failing.evaluate.side_effect = ValueError(message)
+        super_judge.register_judge(failing)
+
+    with pytest.raises(ValueError, match="model unavailable") as exc_info:
+        await super_judge.evaluate("Test Prompt")
+
+    # Assertions: the first error is raised on its own, the other one is logged
+    assert exc_info.value.__suppress_context__
+    assert [record.exc_info[1].args for record in caplog.records] == [("quota exceeded",)]
+
+
+@pytest.mark.asyncio
+async def test_super_judge_shares_duplicate_judges():
+    # Mock Kernel
+    kernel = MagicMock(spec=sk.Kernel)
+    super_judge = SuperJudge(kernel=kernel)
+
+    # The same sub-judge registered twice, as JudgeFactory does for duplicates
+    sub_judge_mock = AsyncMock(spec=JudgeBase)
+
+    async def evaluate(prompt):
+        super_judge.notify(
+            sender=sub_judge_mock,
+            event="evaluation_done",
+            data={"judge_id": "1", "judge_name": "Judge1", "result": "Test Result"},
+        )
+
+    sub_judge_mock.evaluate.side_effect = evaluate
+    super_judge.register_judge(sub_judge_mock)
+    super_judge.register_judge(sub_judge_mock)
+
+    # Run evaluate
+    await super_judge.evaluate("Test Prompt")
+
+    # Assertions
+    sub_judge_mock.evaluate.assert_called_once_with("Test Prompt")
+    assert super_judge.final_verdict() == "Judge1 => Test Result\nJudge1 => Test Result"
+
+
+def test_judge_factory_deduplicates_judges():
+    judge = Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt=METAPROMPT)
+    other = Judge(id="2", name="Judge2", model="https://example.com/model1", metaprompt=METAPROMPT)
+    assembly = Assembly(id="assembly1", judges=[judge, other, judge], roles=["role1"])
+    kernel = MagicMock(spec=sk.Kernel)
+    kernel.get_prompt_execution_settings_from_service_id.return_value = MagicMock()
+
+    with patch("app.judges.ChatCompletionAgent"):
+        judges = JudgeFactory.create_judges(assembly, kernel=kernel)
+
+    # Assertions
+    assert len(judges) == 3
+    assert judges[0] is judges[2]
+    assert judges[0] is not judges[1]
+    # Both distinct judges use the same model, so its settings are looked up once
+    kernel.get_prompt_execution_settings_from_service_id.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_super_judge_stream():
+    super_judge = SuperJudge(kernel=MagicMock(spec=sk.Kernel))
+
+    class EchoJudge(JudgeBase):
+        def __init__(self, name, delay):
+            super().__init__()
+            self.name, self.delay = name, delay
+
+        async def evaluate(self, prompt):
+            await asyncio.sleep(self.delay)
+            self.mediator.notify(
+                sender=self,
+                event="evaluation_done",
+                data={"judge_id": self.name, "judge_name": self.name, "result": prompt},
+            )
+
+    super_judge.register_judge(EchoJudge("Slow", 0.02))
+    super_judge.register_judge(EchoJudge("Fast", 0.0))
+
+    # Run stream
+    events = [item async for item in super_judge.stream("Test Prompt")]
+
+    # Assertions: evaluations arrive in completion order, the verdict comes last
+    # and follows registration order
+    assert [event for event, _ in events] == ["evaluation", "evaluation", "verdict"]
+    assert [data["judge_name"] for _, data in events[:2]] == ["Fast", "Slow"]
+    assert events[-1][1] == {"result": "Slow => Test Prompt\nFast => Test Prompt"}
+
+
 @pytest.mark.asyncio
 async def test_judge_orchestrator_run_evaluation():
     # Mock Assembly and Kernel
     assembly = Assembly(
         id="assembly1",
-        judges=[Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt='{"text": "Test Prompt"}')],
+        judges=[Judge(id="1", name="Judge1", model="https://example.com/model1", metaprompt=METAPROMPT)],
         roles=["role1", "role2"],
     )
     kernel = MagicMock(spec=sk.Kernel)
-    JudgeFactory.build_kernel = MagicMock(return_value=kernel)
 
     # Mock SuperJudge and its methods
     super_judge_mock = AsyncMock(spec=SuperJudge)
-    super_judge_mock.final_verdict.return_value = "Final Verdict"
-    SuperJudge = MagicMock(return_value=super_judge_mock)
+    super_judge_mock.final_verdict = MagicMock(return_value="Final Verdict")
 
     # Run evaluation
-    verdict = await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+    with patch.object(JudgeFactory, "build_kernel", return_value=kernel), patch.object(
+        JudgeFactory, "create_judges", return_value=[]
+    ), patch("app.judges.SuperJudge", return_value=super_judge_mock):
+        verdict = await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
 
     # Assertions
     assert verdict == "Final Verdict"
     super_judge_mock.evaluate.assert_called_once_with("Test Prompt")
 
 
+@pytest.mark.asyncio
+async def test_judge_orchestrator_caches_verdict():
+    assembly = Assembly(id="assembly1", judges=[], roles=["role1"])
+    super_judge_mock = AsyncMock(spec=SuperJudge)
+    super_judge_mock.final_verdict = MagicMock(return_value="Final Verdict")
+
+    with patch.object(JudgeFactory, "build_kernel"), patch(
+        "app.judges.SuperJudge", return_value=super_judge_mock
+    ):
+        first = await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+        second = await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+        JudgeOrchestrator.invalidate("assembly1")
+        third = await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+
+    # Assertions: the second call is a cache hit, the third runs after invalidation
+    assert first == second == third == "Final Verdict"
+    assert super_judge_mock.evaluate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_judge_orchestrator_misses_cache_of_edited_assembly():
+    assembly = Assembly(id="assembly1", judges=[], roles=["role1"])
+    edited = Assembly(id="assembly1", judges=[], roles=["role1", "role2"])
+    super_judge_mock = AsyncMock(spec=SuperJudge)
+    super_judge_mock.final_verdict = MagicMock(return_value="Final Verdict")
+
+    with patch.object(JudgeFactory, "build_kernel"), patch(
+        "app.judges.SuperJudge", return_value=super_judge_mock
+    ):
+        await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+        await JudgeOrchestrator.run_evaluation(edited, "Test Prompt")
+
+    # Assertions: the edited Assembly is evaluated again without any invalidate() call
+    assert super_judge_mock.evaluate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_judge_orchestrator_hashes_assembly_once():
+    assembly = Assembly(id="assembly1", judges=[], roles=["role1"])
+    super_judge_mock = AsyncMock(spec=SuperJudge)
+    super_judge_mock.final_verdict = MagicMock(return_value="Final Verdict")
+
+    with patch.object(JudgeFactory, "build_kernel"), patch(
+        "app.judges.SuperJudge", return_value=super_judge_mock
+    ), patch("app.judges.assembly_version", wraps=assembly_version) as version_mock:
+        await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+
+    # Assertions: the cache lookup and the cache store share one version hash
+    version_mock.assert_called_once_with(assembly)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("verdict", [NO_EVALUATIONS, f"Judge1 => {NO_OUTPUT}"])
+async def test_judge_orchestrator_skips_caching_placeholders(verdict):
+    assembly = Assembly(id="assembly1", judges=[], roles=["role1"])
+    super_judge_mock = AsyncMock(spec=SuperJudge)
+    super_judge_mock.final_verdict = MagicMock(return_value=verdict)
+
+    with patch.object(JudgeFactory, "build_kernel"), patch(
+        "app.judges.SuperJudge", return_value=super_judge_mock
+    ):
+        await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+        await JudgeOrchestrator.run_evaluation(assembly, "Test Prompt")
+
+    # Assertions: the placeholder verdict is not served from the cache
+    assert super_judge_mock.evaluate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_semantic_verdict_cache():
+    vectors = {"a prompt": [1.0, 0.0], "a prompt!": [0.99, 0.05], "unrelated": [0.0, 1.0]}
+
+    async def embed(prompt):
+        return vectors[prompt]
+
+    cache = SemanticVerdictCache(embed=embed, threshold=0.95)
+    cache.set("assembly1", "v1", await cache.embed("a prompt"), "Cached Verdict")
+
+    # Assertions
+    assert cache.get("assembly1", "v1", await cache.embed("a prompt!")) == "Cached Verdict"
+    assert cache.get("assembly1", "v1", await cache.embed("unrelated")) is None
+    assert cache.get("assembly2", "v1", await cache.embed("a prompt")) is None
+    assert cache.get("assembly1", "v2", await cache.embed("a prompt")) is None
+
+
 @pytest.mark.asyncio
 async def test_fetch_assembly():
-    # Mock CosmosClient and its behavior
-    cosmos_client_mock = AsyncMock()
-    cosmos_client_mock.get_database_client.return_value.get_container_client.return_value.read_item.return_value = {
-        "id": "assembly1"
-    }
-    CosmosClient = MagicMock(return_value=cosmos_client_mock)
+    # Mock the shared assemblies container
+    container_mock = AsyncMock()
+    container_mock.read_item.return_value = {"id": "assembly1"}
 
     # Run fetch_assembly
-    assembly = await fetch_assembly("assembly1")
+    assembly = await fetch_assembly(container_mock, "assembly1")
 
     # Assertions
     assert assembly == {"id": "assembly1"}
+    container_mock.read_item.assert_called_once_with(item="assembly1", partition_key="assembly1")
+
+
+@pytest.mark.asyncio
+async def test_fetch_assembly_not_found():
+    # Mock a container that does not hold the assembly
+    container_mock = AsyncMock()
+    container_mock.read_item.side_effect = exceptions.CosmosResourceNotFoundError()
+
+    # Run fetch_assembly
+    assembly = await fetch_assembly(container_mock, "missing")
+
+    # Assertions
+    assert assembly is None
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.plugins import kaggle
+from app.plugins.kaggle import SENTINEL_PREFIX, KaggleDatasetReader
+
+
+@pytest.fixture
+def kaggle_api(monkeypatch):
+    # A fresh mocked client for every test, never reused from the process-wide cache
+    monkeypatch.delenv("KAGGLE_USERNAME", raising=False)
+    monkeypatch.delenv("KAGGLE_KEY", raising=False)
+    kaggle._kaggle_api.cache_clear()
+    with patch.object(kaggle, "KaggleApi") as api_class:
+        api_class.side_effect = lambda: MagicMock()
+        yield api_class
+    kaggle._kaggle_api.cache_clear()
+
+
+def fake_download(files):
+    def download(dataset, path, unzip):
+        for name in files:
+            (path / name).write_text("a,b\n1,2\n")
+
+    return download
+
+
+def test_read_dataset_skips_repeated_download(kaggle_api, tmp_path):
+    reader = KaggleDatasetReader()
+    reader.api.dataset_download_files.side_effect = fake_download(["data.csv"])
+
+    first = reader.read_dataset("owner/data", download_path=tmp_path)
+    second = reader.read_dataset("owner/data", download_path=tmp_path)
+
+    # Assertions: the second call finds the sentinel and does not download again
+    assert first == second == ["data.csv"]
+    assert (tmp_path / f"{SENTINEL_PREFIX}owner__data").exists()
+    reader.api.dataset_download_files.assert_called_once_with(
+        "owner/data", path=tmp_path, unzip=True
+    )
+
+
+def test_read_dataset_force_download(kaggle_api, tmp_path):
+    reader = KaggleDatasetReader()
+    reader.api.dataset_download_files.side_effect = fake_download(["data.csv"])
+
+    reader.read_dataset("owner/data", download_path=tmp_path)
+    reader.read_dataset("owner/data", download_path=tmp_path, force_download=True)
+
+    # Assertions
+    assert reader.api.dataset_download_files.call_count == 2
+
+
+def test_read_dataset_retries_partial_download(kaggle_api, tmp_path):
+    reader = KaggleDatasetReader()
+
+    def interrupted(dataset, path, unzip):
+        (path / "data.csv").write_text("a,b\n")
+        raise ConnectionError("download interrupted")
+
+    reader.api.dataset_download_files.side_effect = interrupted
+    with pytest.raises(ConnectionError):
+        reader.read_dataset("owner/data", download_path=tmp_path)
+
+    reader.api.dataset_download_files.side_effect = fake_download(["data.csv"])
+    df = reader.read_dataset("owner/data", file_name="data.csv", download_path=tmp_path)
+
+    # Assertions: without the sentinel, the next call downloads the dataset again
+    assert reader.api.dataset_download_files.call_count == 2
+    assert df.to_dict("list") == {"a": [1], "b": [2]}
+
+
+def test_readers_share_client_until_credentials_change(kaggle_api):
+    first = KaggleDatasetReader(kaggle_username="user", kaggle_key="key")
+    same = KaggleDatasetReader(kaggle_username="user", kaggle_key="key")
+    default = KaggleDatasetReader()
+    changed = KaggleDatasetReader(kaggle_username="other", kaggle_key="key")
+
+    # Assertions: one authentication per set of credentials
+    assert first.api is same.api is default.api
+    assert changed.api is not first.api
+    assert kaggle_api.call_count == 2
+    changed.api.authenticate.assert_called_once_with()
@@ -0,0 +1,325 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from azure.cosmos import exceptions
+from fastapi.testclient import TestClient
+
+from app import main
+from app.judges import JudgeOrchestrator
+from app.main import app, patch_operations
+from app.schemas import Judge
+
+METAPROMPT = '{"text": "Test Prompt", "json": {}}'
+JUDGE = {
+    "id": "1",
+    "name": "Judge1",
+    "model": "https://example.com/model1",
+    "metaprompt": METAPROMPT,
+}
+EVALUATION = {"id": "assembly1", "prompt": "Test Prompt", "method": "assembly"}
+
+
+class FakePage:
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeContainer:
+    """
+    An in-memory stand-in for a Cosmos DB ContainerProxy, with items partitioned by id.
+    """
+
+    def __init__(self, items=(), page_size=100):
+        self.items = {item["id"]: dict(item) for item in items}
+        self.page_size = page_size
+
+    def query_items(self, query, parameters, max_item_count):
+        items = list(self.items.values())
+        pages = [items[i : i + self.page_size] for i in range(0, len(items), self.page_size)]
+        query_iterable = MagicMock()
+        query_iterable.by_page.return_value = FakePage([FakePage(page) for page in pages])
+        return query_iterable
+
+    async def read_item(self, item, partition_key):
+        if item not in self.items:
+            raise exceptions.CosmosResourceNotFoundError(message=f"{item} not found")
+        return dict(self.items[item])
+
+    async def upsert_item(self, body):
+        self.items[body["id"]] = dict(body)
+        return dict(body)
+
+    async def patch_item(self, item, partition_key, patch_operations):
+        document = await self.read_item(item, partition_key)
+        for operation in patch_operations:
+            document[operation["path"].lstrip("/")] = operation["value"]
+        self.items[item] = document
+        return dict(document)
+
+    async def delete_item(self, item, partition_key):
+        await self.read_item(item, partition_key)
+        del self.items[item]
+
+
+@pytest.fixture
+def containers():
+    # The app state the lifespan would open, without connecting to Cosmos DB
+    judges, assemblies = FakeContainer(), FakeContainer()
+    app.state.judges_container = judges
+    app.state.assemblies_container = assemblies
+    yield judges, assemblies
+    del app.state.judges_container
+    del app.state.assemblies_container
+
+
+@pytest.fixture
+def client(containers):
+    return TestClient(app)
+
+
+def sse_frames(body: bytes):
+    frames = []
+    for frame in body.split(b"\n\n")[:-1]:
+        event, data = frame.split(b"\n")
+        assert event.startswith(b"event: ") and data.startswith(b"data: ")
+        frames.append((event[len(b"event: ") :].decode(), orjson.loads(data[len(b"data: ") :])))
+    return frames
+
+
+def test_lifespan_shares_cosmos_client():
+    with (
+        patch.object(main, "DefaultAzureCredential") as credential_class,
+        patch.object(main, "CosmosClient") as cosmos_class,
+    ):
+        credential = credential_class.return_value = AsyncMock()
+        cosmos = cosmos_class.return_value = MagicMock(close=AsyncMock())
+        database = MagicMock()
+        cosmos.create_database_if_not_exists = AsyncMock(return_value=database)
+        with TestClient(app):
+            # Assertions: the token is acquired and the containers are opened on startup
+            credential.get_token.assert_awaited_once_with(main.COSMOS_SCOPE)
+            assert app.state.cosmos is cosmos
+            assert app.state.judges_container is database.get_container_client.return_value
+
+    # Assertions: both are closed on shutdown
+    cosmos.close.assert_awaited_once()
+    credential.close.assert_awaited_once()
+
+
+@pytest.mark.parametrize("count, page_size", [(0, 100), (1, 100), (5, 2)])
+def test_list_judges_pages(client, containers, count, page_size):
+    judges, _ = containers
+    judges.page_size = page_size
+    for i in range(count):
+        judges.items[str(i)] = {**JUDGE, "id": str(i)}
+
+    response = client.get("/list-judges")
+
+    # Assertions: the streamed body is a single valid JSON document
+    assert response.status_code == 200
+    body = orjson.loads(response.content)
+    assert [item["id"] for item in body["content"]] == [str(i) for i in range(count)]
+    assert body["title"] == f"{count} Judges Retrieved"
+
+
+def test_list_assemblies_fails_before_streaming(client, containers):
+    _, assemblies = containers
+    assemblies.query_items = MagicMock(side_effect=exceptions.CosmosHttpResponseError())
+
+    # Assertions: a failing query is an error response, not a truncated 200
+    with pytest.raises(exceptions.CosmosHttpResponseError):
+        client.get("/list-assemblies")
+
+
+def test_patch_operations_skip_id():
+    judge = Judge(**JUDGE)
+
+    # Assertions
+    assert {"op": "set", "path": "/name", "value": "Judge1"} in patch_operations(judge)
+    assert all(operation["path"] != "/id" for operation in patch_operations(judge))
+
+
+def test_update_judge(client, containers):
+    judges, _ = containers
+    judges.items["1"] = dict(JUDGE)
+
+    response = client.put("/update-judge/1", json={**JUDGE, "name": "Renamed"})
+
+    # Assertions
+    assert response.status_code == 200
+    assert judges.items["1"]["name"] == "Renamed"
+
+
+@pytest.mark.parametrize("path", ["/update-judge/missing", "/update-assembly/missing"])
+def test_update_missing_item(client, path):
+    body = JUDGE if "judge" in path else {"id": "missing", "judges": [], "roles": ["role1"]}
+
+    response = client.put(path, json=body)
+
+    # Assertions
+    assert response.status_code == 404
+
+
+def test_evaluate_stream_frames(client, containers):
+    _, assemblies = containers
+    assemblies.items["assembly1"] = {"id": "assembly1", "judges": [JUDGE], "roles": ["role1"]}
+
+    async def run_evaluation_stream(assembly, prompt):
+        yield "evaluation", {"judge_id": "1", "judge_name": "Judge1", "result": "multi\nline"}
+        yield "verdict", {"result": "Judge1 => multi\nline"}
+
+    with patch.object(JudgeOrchestrator, "run_evaluation_stream", run_evaluation_stream):
+        response = client.post("/evaluate-stream", json=EVALUATION)
+
+    # Assertions: one event and one single-line JSON data field per frame
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert sse_frames(response.content) == [
+        ("evaluation", {"judge_id": "1", "judge_name": "Judge1", "result": "multi\nline"}),
+        ("verdict", {"assembly_id": "assembly1", "result": "Judge1 => multi\nline"}),
+    ]
+
+
+def test_evaluate_stream_error_frame(client, containers):
+    _, assemblies = containers
+    assemblies.items["assembly1"] = {"id": "assembly1", "judges": [JUDGE], "roles": ["role1"]}
+
+    async def run_evaluation_stream(assembly, prompt):
+        yield "evaluation", {"judge_id": "1", "judge_name": "Judge1", "result": "ok"}
+        raise ValueError("model unavailable")
+
+    with patch.object(JudgeOrchestrator, "run_evaluation_stream", run_evaluation_stream):
+        response = client.post("/evaluate-stream", json=EVALUATION)
+
+    # Assertions: the failure is reported as the last frame
+    assert sse_frames(response.content)[-1] == ("error", {"detail": "model unavailable"})
+
+
+def test_evaluate_stream_missing_assembly(client):
+    response = client.post("/evaluate-stream", json={**EVALUATION, "id": "missing"})
+
+    # Assertions
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def served(containers):
+    # A started application, so background evaluations keep running between requests
+    with (
+        patch.object(main, "DefaultAzureCredential", return_value=AsyncMock()),
+        patch.object(
+            main, "CosmosClient", return_value=MagicMock(close=AsyncMock())
+        ) as cosmos_class,
+    ):
+        cosmos_class.return_value.create_database_if_not_exists = AsyncMock(
+            return_value=MagicMock()
+        )
+        with TestClient(app) as client:
+            judges, assemblies = containers
+            app.state.judges_container = judges
+            app.state.assemblies_container = assemblies
+            assemblies.items["assembly1"] = {"id": "assembly1", "judges": [], "roles": ["role1"]}
+            yield client
+
+
+def poll(client, task_id):
+    for _ in range(100):
+        response = client.get(f"/evaluate/{task_id}")
+        if response.status_code != 202:
+            return response
+        time.sleep(0.01)
+    return response
+
+
+def test_evaluate_async_stores_verdict(served, containers):
+    _, assemblies = containers
+
+    with patch.object(JudgeOrchestrator, "run_evaluation", AsyncMock(return_value="Verdict")):
+        accepted = served.post("/evaluate-async", json=EVALUATION)
+        task_id = accepted.json()["content"]["task_id"]
+        response = poll(served, task_id)
+
+    # Assertions: the verdict is read from the record in Cosmos DB
+    assert accepted.status_code == 202
+    assert response.status_code == 200
+    assert response.json()["content"] == {
+        "assembly_id": "assembly1",
+        "task_id": task_id,
+        "result": "Verdict",
+    }
+    assert assemblies.items[task_id]["status"] == "done"
+    assert not app.state.evaluation_tasks
+
+
+def test_evaluate_async_records_failure(served):
+    run_evaluation = AsyncMock(side_effect=ValueError("model unavailable"))
+
+    with patch.object(JudgeOrchestrator, "run_evaluation", run_evaluation):
+        task_id = served.post("/evaluate-async", json=EVALUATION).json()["content"]["task_id"]
+        response = poll(served, task_id)
+
+    # Assertions: the error is stored with the record, not left on the task
+    assert response.status_code == 500
+    assert response.json()["detail"] == "model unavailable"
+
+
+def test_evaluate_async_limits_running_evaluations(served, containers):
+    _, assemblies = containers
+
+    async def hang(assembly, prompt):
+        await asyncio.sleep(3600)
+
+    with (
+        patch.object(JudgeOrchestrator, "run_evaluation", hang),
+        patch.object(main, "MAX_RUNNING_EVALUATIONS", 1),
+    ):
+        accepted = served.post("/evaluate-async", json=EVALUATION)
+        rejected = served.post("/evaluate-async", json=EVALUATION)
+        pending = served.get(f"/evaluate/{accepted.json()['content']['task_id']}")
+
+    # Assertions
+    assert accepted.status_code == 202
+    assert rejected.status_code == 429
+    assert pending.status_code == 202
+    assert [item["status"] for item in assemblies.items.values() if "task_id" in item] == [
+        "running"
+    ]
+
+
+def test_get_evaluation_from_another_worker(client, containers):
+    _, assemblies = containers
+    assemblies.items["task1"] = {
+        "id": "task1",
+        "task_id": "task1",
+        "assembly_id": "assembly1",
+        "status": "done",
+        "result": "Verdict",
+    }
+
+    response = client.get("/evaluate/task1")
+
+    # Assertions: any worker answers from the stored record
+    assert response.status_code == 200
+    assert response.json()["content"]["result"] == "Verdict"
+
+
+@pytest.mark.parametrize("task_id", ["missing", "assembly1"])
+def test_get_evaluation_not_found(client, containers, task_id):
+    _, assemblies = containers
+    assemblies.items["assembly1"] = {"id": "assembly1", "judges": [], "roles": ["role1"]}
+
+    response = client.get(f"/evaluate/{task_id}")
+
+    # Assertions: neither a missing item nor an Assembly is an evaluation
+    assert response.status_code == 404
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from app.plugins.statistics import StatisticalAnalysisPlugin
+
+
+def test_category_statistics_all_nan_column():
+    df = pd.DataFrame({"cat": [1, 1, 2], "a": [np.nan] * 3, "b": [1.0, 2.0, 3.0]})
+
+    result = StatisticalAnalysisPlugin().compute_category_statistics(df, "cat")
+
+    # Assertions: a column without values yields NaN statistics instead of raising
+    assert result[("a", "mode")].isna().all()
+    assert result[("a", "mean")].isna().all()
+    assert result[("b", "mode")].tolist() == [1.0, 3.0]
+
+
+def test_category_statistics_empty_frame():
+    df = pd.DataFrame({"cat": pd.Series([], dtype=int), "a": pd.Series([], dtype=float)})
+
+    result = StatisticalAnalysisPlugin().compute_category_statistics(df, "cat")
+
+    # Assertions
+    assert result.empty
+    assert ("a", "mode") in result.columns
+
+
+def test_category_statistics_polars_matches_pandas():
+    pl = pytest.importorskip("polars")
+    df = pd.DataFrame({"cat": [1, 1, 1, 1, 2, 2, 2], "a": [1, 2, np.nan, np.nan, 3, 3, 4]})
+    plugin = StatisticalAnalysisPlugin()
+
+    expected = plugin.compute_category_statistics(df, "cat")
+    result = plugin.compute_category_statistics(pl.from_pandas(df), "cat")
+
+    # Assertions: missing values never win the mode
+    assert result[("a", "mode")].tolist() == [1.0, 3.0]
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def reference_statistics(values, percentiles):
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return {"mode": np.nan, "median": np.nan, "mean": np.nan, "variance": np.nan}
+    reference = {
+        "mode": stats.mode(values).mode,
+        "median": np.median(values),
+        "mean": np.mean(values),
+        "variance": np.var(values, ddof=1) if values.size > 1 else np.nan,
+        "skewness": stats.skew(values, bias=values.size <= 2),
+        "kurtosis": stats.kurtosis(values, bias=values.size <= 3),
+    }
+    for perc in percentiles:
+        reference[f"percentile_{perc}"] = np.percentile(values, perc)
+    return reference
+
+
+@pytest.mark.filterwarnings("ignore:Precision loss")
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(0).normal(size=101),
+        np.array([1.0, np.nan, 2.0, 2.0, np.nan, 7.0, 3.0]),
+        np.array([4.0, 4.0, 4.0, 4.0]),
+        np.array([1.0, 5.0, 2.0]),
+        np.array([3.0]),
+    ],
+    ids=["normal", "nan", "constant", "three", "single"],
+)
+def test_calculate_statistics_matches_numpy_and_scipy(values):
+    percentiles = [0, 1, 5, 25, 50, 75, 95, 99, 100]
+
+    result = StatisticalAnalysisPlugin().calculate_statistics(values, percentiles)
+
+    # Assertions
+    for name, expected in reference_statistics(values, percentiles).items():
+        np.testing.assert_allclose(result[name], expected, err_msg=name)
+
+
+@pytest.mark.filterwarnings("ignore:Precision loss")
+def test_category_statistics_match_per_group_reference():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "cat": ["normal"] * 50 + ["nan"] * 6 + ["constant"] * 4 + ["tiny"] * 2 + ["empty"] * 3,
+            "a": np.r_[
+                rng.normal(size=50),
+                [1.0, np.nan, 2.0, 2.0, np.nan, 7.0],
+                [4.0] * 4,
+                [1.0, 5.0],
+                [np.nan] * 3,
+            ],
+        }
+    )
+    percentiles = [5, 25, 50, 75, 95]
+
+    result = StatisticalAnalysisPlugin().compute_category_statistics(df, "cat", ["a"], percentiles)
+
+    # Assertions: every group matches numpy and scipy run on that group alone
+    for category, group in df.groupby("cat"):
+        expected = reference_statistics(group["a"].to_numpy(), percentiles)
+        for name, value in expected.items():
+            np.testing.assert_allclose(
+                result.loc[category, ("a", name)], value, err_msg=f"{category} {name}"
+            )
+
+
+@pytest.mark.parametrize("percentiles", [[-1], [50, 101], [np.nan]])
+def test_calculate_statistics_rejects_out_of_range_percentiles(percentiles):
+    with pytest.raises(ValueError, match=r"\[0, 100\]"):
+        StatisticalAnalysisPlugin().calculate_statistics([1.0, 2.0, 3.0], percentiles)